@@ -1,5 +1,10 @@
 from manim import *
 
+from toolkit import alignment
+
+# Reuse point alignment between shapes that were morphed before
+alignment.install()
+
 
 # class CreateCircle(Scene):
 #     def construct(self):
@@ -101,16 +106,9 @@ class StickPerson(Scene):
 
 
 if __name__ == "__main__":
-    import subprocess
     import sys
-    from pathlib import Path
-
-    # Default scene to run (change this to run a different scene)
-    scene_name = "StickPerson"
-    
-    # Get the path to this file
-    this_file = Path(__file__).resolve()
-    
-    # Run manim command
-    cmd = ["manim", "-pql", str(this_file), scene_name]
-    subprocess.run(cmd)
\ No newline at end of file
+
+    from toolkit.render import main
+
+    # Render and open every scene in this file; pass --scene NAME to pick one
+    sys.exit(main([__file__, "--preview", *sys.argv[1:]]))
@@ -1,11 +1,35 @@
 from manim import *
 import numpy as np
 
-class righttriangle(Scene):
+from toolkit import alignment, hashing, holds
+from toolkit.dashes import DashedCamera, NativeDashedLine
+from toolkit.layers import LayeredScene
+from toolkit.tex_batch import precompile_scene_tex
+from toolkit.tex_cache import cached_tex, prefetch_tex
+from toolkit.text_cache import cached_text
+
+# Rehash only the mobjects that changed between plays
+hashing.install()
+# Encode each wait as one held frame (HOLD_FRAMES=cfr for a constant frame rate)
+holds.install()
+# Reuse point alignment between shapes that were morphed before
+alignment.install()
+
+class righttriangle(LayeredScene):
+    def __init__(self, **kwargs):
+        # Strokes the dashed lines below with Cairo dash patterns
+        super().__init__(camera_class=DashedCamera, **kwargs)
+
     def construct(self):
         # Zoom out to fit everything on screen
         self.camera.frame_width = 20
         self.camera.frame_height = 12
+
+        # Typeset the equations below in one LaTeX run before they are built
+        precompile_scene_tex(__file__)
+
+        # Compile every vertex letter in one LaTeX run (or load it from the glyph cache)
+        prefetch_tex("ABCDEFGHKLM")
         
         # Triangle vertices: A (top), B (left), C (right)
         # (These points also define the label coordinates below.)
@@ -24,9 +48,9 @@ class righttriangle(Scene):
         right_angle = RightAngle(line1, line2, length=0.4, quadrant=(-1,-1))
         
         # Labels (hard-coded coordinates; no label-position calculations)
-        label_A = MathTex("A").move_to([-0.85, 2.30, 0])
-        label_B = MathTex("B").move_to([-2.75, -0.65, 0])
-        label_C = MathTex("C").move_to([2.75, -0.65, 0])
+        label_A = cached_tex("A").move_to([-0.85, 2.30, 0])
+        label_B = cached_tex("B").move_to([-2.75, -0.65, 0])
+        label_C = cached_tex("C").move_to([2.75, -0.65, 0])
         
         # Step 1: Create triangle
         self.play(Create(triangle))
@@ -42,12 +66,12 @@ class righttriangle(Scene):
         self.play(Create(square1), Create(square2), Create(square3), run_time=1.5)
         
         # Square vertex labels
-        label_D = MathTex("D").move_to([-2.7475, -5.6475, 0])
-        label_E = MathTex("E").move_to([2.7475, -5.6475, 0])
-        label_F = MathTex("F").move_to([-3.1495, 4.1465, 0])
-        label_G = MathTex("G").move_to([-5.2465, 1.3505, 0])
-        label_H = MathTex("H").move_to([5.2465, 2.8495, 0])
-        label_K = MathTex("K").move_to([1.6505, 5.5465, 0])
+        label_D = cached_tex("D").move_to([-2.7475, -5.6475, 0])
+        label_E = cached_tex("E").move_to([2.7475, -5.6475, 0])
+        label_F = cached_tex("F").move_to([-3.1495, 4.1465, 0])
+        label_G = cached_tex("G").move_to([-5.2465, 1.3505, 0])
+        label_H = cached_tex("H").move_to([5.2465, 2.8495, 0])
+        label_K = cached_tex("K").move_to([1.6505, 5.5465, 0])
         self.play(Write(VGroup(label_D, label_E, label_F, label_G, label_H, label_K)))
         self.wait(0.5)
         
@@ -55,23 +79,23 @@ class righttriangle(Scene):
         # Height from A to BC: M is the foot, and AM is dotted
         pM = np.array([-0.7, -0.4, 0])   # on BC
         dot_M = Dot(pM, color=WHITE, radius=0.05)
-        label_M = MathTex("M").move_to([-1.0, -0.1, 0])
-        dashed_AM = DashedLine(pA, pM, color=WHITE, stroke_width=2, dash_length=0.08)
+        label_M = cached_tex("M").move_to([-1.0, -0.1, 0])
+        dashed_AM = NativeDashedLine(pA, pM, color=WHITE, stroke_width=2, dash_length=0.08)
         
         # Extend AM down to DE; intersection point is L
         pD = np.array([-2.5, -5.4, 0])
         pE = np.array([2.5, -5.4, 0])
         pL = np.array([-0.7, -5.4, 0])
         dot_L = Dot(pL, color=WHITE, radius=0.05)
-        label_L = MathTex("L").move_to([-1.0, -5.8, 0])
-        dashed_ML = DashedLine(pM, pL, color=WHITE, stroke_width=2, dash_length=0.08)
+        label_L = cached_tex("L").move_to([-1.0, -5.8, 0])
+        dashed_ML = NativeDashedLine(pM, pL, color=WHITE, stroke_width=2, dash_length=0.08)
         
         # Extra dotted lines: AD and GC
         # F is chosen so that F-A-C are collinear (FAC is a straight line)
         pF = np.array([-3.1, 3.8, 0])
         pG = np.array([-4.9, 1.4, 0])
-        dashed_AD = DashedLine(pA, pD, color=WHITE, stroke_width=2, dash_length=0.08)
-        dashed_GC = DashedLine(pG, pC, color=WHITE, stroke_width=2, dash_length=0.08)
+        dashed_AD = NativeDashedLine(pA, pD, color=WHITE, stroke_width=2, dash_length=0.08)
+        dashed_GC = NativeDashedLine(pG, pC, color=WHITE, stroke_width=2, dash_length=0.08)
         
         self.play(Create(dashed_AM), FadeIn(dot_M), Write(label_M))
         self.play(Create(dashed_ML), FadeIn(dot_L), Write(label_L))
@@ -87,7 +111,7 @@ class righttriangle(Scene):
 
         # 2) Highlight the line FAC + explanation text
         highlight_FAC = Line(pF, pC, color=YELLOW, stroke_width=8)
-        explain_FAC = Text(
+        explain_FAC = cached_text(
             "FAC is a staight line,\nFA and AC lie on the same line",
             font_size=28,
         ).move_to([7.2, 1.6, 0])
@@ -121,9 +145,9 @@ class righttriangle(Scene):
         # Small labels for mini GBC (after it has moved)
         g2, b2, c2 = mini_GBC.get_vertices()  # G', B', C'
         center_gbc = mini_GBC.get_center()
-        mini_G_label = MathTex("G").scale(0.6).move_to(g2 + (g2 - center_gbc) / np.linalg.norm(g2 - center_gbc) * 0.25)
-        mini_B_label_1 = MathTex("B").scale(0.6).move_to(b2 + (b2 - center_gbc) / np.linalg.norm(b2 - center_gbc) * 0.25)
-        mini_C_label = MathTex("C").scale(0.6).move_to(c2 + (c2 - center_gbc) / np.linalg.norm(c2 - center_gbc) * 0.25)
+        mini_G_label = cached_tex("G").scale(0.6).move_to(g2 + (g2 - center_gbc) / np.linalg.norm(g2 - center_gbc) * 0.25)
+        mini_B_label_1 = cached_tex("B").scale(0.6).move_to(b2 + (b2 - center_gbc) / np.linalg.norm(b2 - center_gbc) * 0.25)
+        mini_C_label = cached_tex("C").scale(0.6).move_to(c2 + (c2 - center_gbc) / np.linalg.norm(c2 - center_gbc) * 0.25)
         self.play(Write(VGroup(mini_G_label, mini_B_label_1, mini_C_label)))
         self.wait(0.6)
 
@@ -143,9 +167,9 @@ class righttriangle(Scene):
         # Small labels for mini ABD (after it has rotated+moved)
         a2, b3, d2 = mini_ABD.get_vertices()  # A', B', D'
         center_abd = mini_ABD.get_center()
-        mini_A_label = MathTex("A").scale(0.6).move_to(a2 + (a2 - center_abd) / np.linalg.norm(a2 - center_abd) * 0.25)
-        mini_B_label_2 = MathTex("B").scale(0.6).move_to(b3 + (b3 - center_abd) / np.linalg.norm(b3 - center_abd) * 0.25)
-        mini_D_label = MathTex("D").scale(0.6).move_to(d2 + (d2 - center_abd) / np.linalg.norm(d2 - center_abd) * 0.25)
+        mini_A_label = cached_tex("A").scale(0.6).move_to(a2 + (a2 - center_abd) / np.linalg.norm(a2 - center_abd) * 0.25)
+        mini_B_label_2 = cached_tex("B").scale(0.6).move_to(b3 + (b3 - center_abd) / np.linalg.norm(b3 - center_abd) * 0.25)
+        mini_D_label = cached_tex("D").scale(0.6).move_to(d2 + (d2 - center_abd) / np.linalg.norm(d2 - center_abd) * 0.25)
         self.play(Write(VGroup(mini_A_label, mini_B_label_2, mini_D_label)))
         self.wait(0.6)
 
@@ -170,7 +194,7 @@ class righttriangle(Scene):
         self.wait(0.9)
 
         # 8) Write "GB=AB" bottom-left
-        text_GB_AB = Text("GB = AB (same sides on a square)", font_size=28).move_to([-5.8, -4.8, 0])
+        text_GB_AB = cached_text("GB = AB (same sides on a square)", font_size=28).move_to([-5.8, -4.8, 0])
         self.play(Write(text_GB_AB))
         self.wait(1.2)
 
@@ -191,7 +215,7 @@ class righttriangle(Scene):
         self.wait(0.9)
 
         # 10) Write "BC=BD" bottom-left
-        text_BC_BD = Text("BC = BD (same sides on a square)", font_size=28).move_to([-5.8, -5.6, 0])
+        text_BC_BD = cached_text("BC = BD (same sides on a square)", font_size=28).move_to([-5.8, -5.6, 0])
         self.play(Write(text_BC_BD))
         self.wait(2)
 
@@ -297,3 +321,11 @@ class righttriangle(Scene):
         square.rotate(angle, about_point=square.get_center())
         return square
 
+
+if __name__ == "__main__":
+    import sys
+
+    from toolkit.render import main
+
+    # Render and open the scene; see python -m toolkit.render -h for options
+    sys.exit(main([__file__, "--preview", *sys.argv[1:]]))
@@ -1,13 +1,46 @@
+from pathlib import Path
+
 from manim import *
-import random
+import numpy as np
+
+from toolkit import hashing, holds
+from toolkit.coords import axes_points, tick_step
+from toolkit.ensemble import column_centres, density_quantiles, walk_density
+from toolkit.graphs import AreaBetween, VectorizedGraph
+from toolkit.lod import decimate_for_screen
+from toolkit.mobjects import DensityImage, SegmentBatch
+from toolkit.paths import CreatePath, FollowPath
+from toolkit.tex_batch import precompile_scene_tex
+from toolkit.walks import WalkParams, lattice_edges, stacked_opacity, walk_for
+
+# Rehash only the mobjects that changed between plays
+hashing.install()
+# Encode the final wait as one held frame (HOLD_FRAMES=cfr for a constant frame rate)
+holds.install()
 
 
 class RandomWalk(Scene):
     def construct(self):
-        # Create axes
+        # Typeset the curve labels in one LaTeX run before they are built
+        precompile_scene_tex(__file__)
+
+        # Parameters for the random walk (defaults: 8 steps in the tree, 500 more
+        # in the continuation, step size 1); see WalkParams for overriding them
+        params = WalkParams.load()
+        if params.seed is None:
+            params.seed = self.random_seed  # manim's --seed, if one was given
+        num_steps = params.num_steps  # Number of steps in x direction
+        step_size = params.step_size  # Step size in x and y
+        additional_steps = params.additional_steps
+        
+        # Create axes large enough for the whole tree: num_steps steps across and
+        # up to num_steps steps up or down (at least the original 10 by +-5)
+        tree_extent = num_steps * step_size
+        axes_x_max = max(10, float(np.ceil(tree_extent)))
+        axes_y_max = max(5, float(np.ceil(tree_extent)))
         axes = Axes(
-            x_range=[0, 10, 1],
-            y_range=[-5, 5, 1],
+            x_range=[0, axes_x_max, tick_step(axes_x_max)],
+            y_range=[-axes_y_max, axes_y_max, tick_step(2 * axes_y_max)],
             x_length=10,
             y_length=6,
             axis_config={"color": WHITE},
@@ -25,45 +58,30 @@ class RandomWalk(Scene):
         self.play(Create(axes), Write(x_label), Write(y_label))
         self.wait(0.5)
         
-        # Parameters for the random walk
-        num_steps = 8  # Number of steps in x direction
-        step_size = 1.0  # Step size in x and y
-        
-        # Generate all possible paths (binary tree)
-        # Each path is a sequence of up/down moves
-        all_paths = []
-        
-        def generate_paths(steps):
-            """Generate all 2^steps possible paths"""
-            if steps == 0:
-                return [[]]
-            shorter_paths = generate_paths(steps - 1)
-            return [path + [1] for path in shorter_paths] + [path + [-1] for path in shorter_paths]
-        
-        all_paths = generate_paths(num_steps)
+        # The whole walk up front: the tree highlights its first num_steps steps
+        # and the continuation draws the rest. Seeded walks are cached on disk.
+        heights = walk_for(params, Path(config.media_dir) / "walk_cache")
         
-        # Create lines step by step, spreading out based on x
-        # We'll build the tree level by level (x by x)
+        # Build the tree from the binomial lattice instead of enumerating all
+        # 2^num_steps paths: every distinct edge is drawn once, with the opacity
+        # that stacking all the paths running along it would have given
+        steps, y_starts, y_ends, counts = lattice_edges(num_steps)
+        opacities = np.round(stacked_opacity(counts, 0.3), 2)
+        starts = axes_points(axes, steps * step_size, y_starts * step_size)
+        ends = axes_points(axes, (steps + 1) * step_size, y_ends * step_size)
         
-        # Store all line segments grouped by x-step
+        # Store all line segments grouped by x-step; edges of a step that share
+        # an opacity go into one SegmentBatch so they render as a single mobject
         step_segments = [VGroup() for _ in range(num_steps)]
         all_segments = VGroup()  # Container for all segments
         
-        # Build the segments for each path
-        for path in all_paths:
-            x = 0
-            y = 0
-            
-            for step_idx, direction in enumerate(path):
-                start_point = axes.c2p(x, y)
-                x += step_size
-                y += direction * step_size
-                end_point = axes.c2p(x, y)
-                
-                # Create a line segment for this step
-                segment = Line(start_point, end_point)
-                segment.set_stroke(GRAY, width=1, opacity=0.3)
-                step_segments[step_idx].add(segment)
+        for step_idx in range(num_steps):
+            in_step = steps == step_idx
+            for opacity in np.unique(opacities[in_step]):
+                edges = in_step & (opacities == opacity)
+                batch = SegmentBatch(starts[edges], ends[edges])
+                batch.set_stroke(GRAY, width=1, opacity=float(opacity))
+                step_segments[step_idx].add(batch)
         
         # Animate each x-step appearing simultaneously
         for step_group in step_segments:
@@ -72,22 +90,12 @@ class RandomWalk(Scene):
         
         self.wait(0.5)
         
-        # Choose one random path to highlight
-        chosen_path_index = random.randint(0, len(all_paths) - 1)
-        chosen_path = all_paths[chosen_path_index]
-        
         # Create the highlighted path
-        points = [axes.c2p(0, 0)]
-        x = 0
-        y = 0
-        
-        for direction in chosen_path:
-            x += step_size
-            y += direction * step_size
-            points.append(axes.c2p(x, y))
+        chosen_xs = np.arange(num_steps + 1) * step_size
+        chosen_ys = heights[: num_steps + 1] * step_size
         
         highlighted_path = VMobject()
-        highlighted_path.set_points_as_corners(points)
+        highlighted_path.set_points_as_corners(axes_points(axes, chosen_xs, chosen_ys))
         highlighted_path.set_stroke(BLUE, width=4)
         
         # Add a dot to trace along the path
@@ -97,8 +105,8 @@ class RandomWalk(Scene):
         self.play(Create(dot))
         self.bring_to_front(dot)  # Keep dot in front of the path
         self.play(
-            Create(highlighted_path),
-            MoveAlongPath(dot, highlighted_path),
+            CreatePath(highlighted_path),
+            FollowPath(dot, highlighted_path),
             run_time=4,
             rate_func=linear
         )
@@ -114,30 +122,18 @@ class RandomWalk(Scene):
         
         self.wait(0.5)
         
-        # Generate additional steps for the continuation (500 more steps)
-        additional_steps = 500
-        continuation_path = [random.choice([1, -1]) for _ in range(additional_steps)]
-        
-        # Calculate the full walk (first 8 steps + 500 additional steps)
-        total_steps = num_steps + additional_steps
-        full_path = chosen_path + continuation_path
-        
-        # Calculate the y range for the full walk
-        y = 0
-        min_y = 0
-        max_y = 0
-        
-        for direction in full_path:
-            y += direction * step_size
-            min_y = min(min_y, y)
-            max_y = max(max_y, y)
+        # The full walk (first num_steps steps + additional_steps more)
+        total_steps = params.total_steps
+        x_extent = total_steps * step_size
+        full_xs = np.arange(total_steps + 1) * step_size
+        full_ys = heights * step_size
         
         # Create buffer for y range
-        y_range_buffer = max(abs(min_y), abs(max_y)) * 1.2
+        y_range_buffer = float(max(abs(full_ys.min()), abs(full_ys.max()))) * 1.2
         
         # Create new axes that show the full walk with smaller step size
         new_axes = Axes(
-            x_range=[0, total_steps, 50],
+            x_range=[0, x_extent, tick_step(x_extent)],
             y_range=[-y_range_buffer, y_range_buffer, max(10, int(y_range_buffer/5))],
             x_length=10,
             y_length=6,
@@ -152,17 +148,8 @@ class RandomWalk(Scene):
         new_y_label = new_axes.get_y_axis_label("y", edge=LEFT, direction=LEFT)
         
         # Recreate the first walk on the new axes (compressed)
-        compressed_points = [new_axes.c2p(0, 0)]
-        x = 0
-        y = 0
-        
-        for direction in chosen_path:
-            x += step_size
-            y += direction * step_size
-            compressed_points.append(new_axes.c2p(x, y))
-        
         compressed_path = VMobject()
-        compressed_path.set_points_as_corners(compressed_points)
+        compressed_path.set_points_as_corners(axes_points(new_axes, chosen_xs, chosen_ys))
         compressed_path.set_stroke(BLUE, width=4)
         
         # Transform the old axes to new axes and compress the highlighted path
@@ -179,28 +166,22 @@ class RandomWalk(Scene):
       
         
         # Create the continuation path (starts from where first walk ended)
-        continuation_points = [new_axes.c2p(num_steps, y)]  # Start from end of first walk
-        x = num_steps
-        # y is already at the correct value from the loop above
-        
-        for direction in continuation_path:
-            x += step_size
-            y += direction * step_size
-            continuation_points.append(new_axes.c2p(x, y))
+        continuation_points = axes_points(new_axes, full_xs[num_steps:], full_ys[num_steps:])
         
+        # Only a couple of thousand pixel columns are visible, so the line keeps
+        # just the per-column envelope of the walk
         continuation_line = VMobject()
-        continuation_line.set_points_as_corners(continuation_points)
+        continuation_line.set_points_as_corners(decimate_for_screen(continuation_points))
         continuation_line.set_stroke(BLUE, width=2)
         
         # Draw the continuation (still in blue)
         # Start dot at the end of the first walk
-        continuation_dot = Dot(new_axes.c2p(num_steps, sum([d * step_size for d in chosen_path])), 
-                               color=BLUE, radius=0.06)
+        continuation_dot = Dot(continuation_points[0], color=BLUE, radius=0.06)
         self.play(Create(continuation_dot))
         self.bring_to_front(continuation_dot)  # Keep dot in front of the path
         self.play(
-            Create(continuation_line),
-            MoveAlongPath(continuation_dot, continuation_line),
+            CreatePath(continuation_line),
+            FollowPath(continuation_dot, continuation_line),
             run_time=6,
             rate_func=linear
         )
@@ -211,13 +192,13 @@ class RandomWalk(Scene):
         
         # Adding y=x and y=-x reference lines
         # Use visible range for x_range
-        max_visible_x = min(total_steps, y_range_buffer)
-        y_equals_x = new_axes.plot(lambda x: x, x_range=[0, max_visible_x], color=YELLOW, stroke_width=2)
-        y_equals_neg_x = new_axes.plot(lambda x: -x, x_range=[0, max_visible_x], color=YELLOW, stroke_width=2)
+        max_visible_x = min(x_extent, y_range_buffer)
+        y_equals_x = VectorizedGraph(new_axes, lambda x: x, x_range=[0, max_visible_x], color=YELLOW, stroke_width=2)
+        y_equals_neg_x = VectorizedGraph(new_axes, np.negative, x_range=[0, max_visible_x], color=YELLOW, stroke_width=2)
         
-        # Add labels for the lines - position at specific coordinates
-        label_x_pos = 40
-        label_y_pos = 17
+        # Add labels for the lines - on the lines, most of the way to their ends
+        label_x_pos = 0.6 * max_visible_x
+        label_y_pos = label_x_pos
         
         y_x_label = MathTex("y=x", color=YELLOW).scale(0.6)
         y_x_label.next_to(new_axes.c2p(label_x_pos, label_y_pos), UP)
@@ -240,12 +221,12 @@ class RandomWalk(Scene):
         )
         
         # Adding y=x^0.5 and y=-x^0.5 reference lines
-        y_equals_sqrt_x = new_axes.plot(lambda x: x**0.5, x_range=[0, 500], color=PINK, stroke_width=2)
-        y_equals_neg_sqrt_x = new_axes.plot(lambda x: -(x**0.5), x_range=[0, 500], color=PINK, stroke_width=2)
+        y_equals_sqrt_x = VectorizedGraph(new_axes, np.sqrt, x_range=[0, x_extent], color=PINK, stroke_width=2)
+        y_equals_neg_sqrt_x = VectorizedGraph(new_axes, lambda x: -np.sqrt(x), x_range=[0, x_extent], color=PINK, stroke_width=2)
         
-        # Add labels for the sqrt lines
-        sqrt_label_x_pos = 200
-        sqrt_label_y_pos = 17
+        # Add labels for the sqrt lines - on the curves, kept inside the y range
+        sqrt_label_x_pos = 0.4 * x_extent
+        sqrt_label_y_pos = min(np.sqrt(sqrt_label_x_pos), 0.8 * y_range_buffer)
         
         y_sqrt_x_label = MathTex("y=x^{0.5}", color=PINK).scale(0.6)
         y_sqrt_x_label.next_to(new_axes.c2p(sqrt_label_x_pos, sqrt_label_y_pos), UP)
@@ -266,32 +247,46 @@ class RandomWalk(Scene):
             run_time=1.5
         )
         
-        # Shade the area between the pink lines
-        # Create filled area between y=x^0.5 and y=-x^0.5
-        # Generate points along both curves
-        num_points = 100
-        area_points = []
-        
-        # Points along the upper curve (y=x^0.5) from right to left
-        for i in range(num_points, -1, -1):
-            x = 500 * (i / num_points)
-            y = x**0.5
-            area_points.append(new_axes.c2p(x, y))
-        
-        # Points along the lower curve (y=-x^0.5) from left to right
-        for i in range(num_points + 1):
-            x = 500 * (i / num_points)
-            y = -(x**0.5)
-            area_points.append(new_axes.c2p(x, y))
-        
-        # Close the polygon
-        area_points.append(area_points[0])
-        
-        # Create filled polygon
-        filled_area = Polygon(*area_points, fill_opacity=0.3, fill_color=PINK, stroke_width=0)
+        # Shade the area between the pink lines, reusing the samples of both curves
+        filled_area = AreaBetween(
+            y_equals_sqrt_x, y_equals_neg_sqrt_x, fill_opacity=0.3, fill_color=PINK, stroke_width=0
+        )
         
         # Animate the shading
         self.play(FadeIn(filled_area), run_time=1.5)
+        
+        # Ensemble mode: simulate many walks and show where they actually went,
+        # with the empirical one-sigma envelope next to the sqrt curves
+        if params.ensemble_walks:
+            y_max = y_range_buffer / step_size
+            counts = walk_density(
+                params.ensemble_walks,
+                total_steps,
+                y_max,
+                seed=params.seed,
+                workers=params.ensemble_workers,
+            )
+            density_image = DensityImage(
+                counts,
+                new_axes,
+                x_range=[0, (total_steps + 1) * step_size],
+                y_range=[-y_range_buffer, y_range_buffer],
+                color=PINK,
+            )
+            density_image.set_z_index(-1)  # Keep it behind the walk and the curves
+            
+            envelope_xs = column_centres(total_steps, counts.shape[0]) * step_size
+            envelopes = VGroup()
+            for quantile_ys in density_quantiles(counts, y_max, [0.1587, 0.8413]):
+                known = ~np.isnan(quantile_ys)
+                envelope = VMobject()
+                envelope.set_points_as_corners(
+                    axes_points(new_axes, envelope_xs[known], quantile_ys[known] * step_size)
+                )
+                envelope.set_stroke(PINK, width=2, opacity=0.6)
+                envelopes.add(envelope)
+            
+            self.play(FadeIn(density_image), Create(envelopes), run_time=2)
 
         # Final pause
         self.wait(2)
@@ -300,16 +295,28 @@ class RandomWalk(Scene):
 
 
 if __name__ == "__main__":
-    import subprocess
+    import argparse
+    import os
     import sys
-    from pathlib import Path
 
-    # Scene to run
-    scene_name = "RandomWalk"
-    
-    # Get the path to this file
-    this_file = Path(__file__).resolve()
-    
-    # Run manim command
-    cmd = ["manim", "-pql", str(this_file), scene_name]
-    subprocess.run(cmd)
+    from toolkit.render import main
+
+    # Walk parameters reach the scene through RANDOMWALK_* environment variables;
+    # every other flag goes to the render runner (see python -m toolkit.render -h)
+    parser = argparse.ArgumentParser(description="Render the RandomWalk scene", add_help=False)
+    parser.add_argument("--config", help="JSON file with RandomWalk parameters")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--num-steps", type=int)
+    parser.add_argument("--additional-steps", type=int)
+    parser.add_argument("--step-size", type=float)
+    parser.add_argument("--ensemble-walks", type=int, help="simulate this many walks and show their density")
+    parser.add_argument("--ensemble-workers", type=int)
+    args, runner_args = parser.parse_known_args()
+
+    if args.config:
+        os.environ["RANDOMWALK_CONFIG"] = args.config
+    for name in ("seed", "num_steps", "additional_steps", "step_size", "ensemble_walks", "ensemble_workers"):
+        if getattr(args, name) is not None:
+            os.environ[f"RANDOMWALK_{name.upper()}"] = str(getattr(args, name))
+
+    sys.exit(main([__file__, "--preview", *runner_args]))
@@ -1,5 +1,15 @@
+from pathlib import Path
+import sys
+
 from manim import *
 
+# manim only puts this folder on sys.path; the toolkit lives in the repository root
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from toolkit.text_cache import cached_text
+
 class SimpleDemo(Scene):
     def construct(self):
         circle = Circle()
@@ -10,7 +20,8 @@ class SimpleDemo(Scene):
         square.next_to(circle, RIGHT)
         self.play(Create(square))
         
-        text = Text("Manim Demo")
+        # Outlines come from media/text_cache after the first render
+        text = cached_text("Manim Demo")
         text.next_to(VGroup(circle, square), UP)
         self.play(Write(text))
         self.wait()
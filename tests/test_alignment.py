@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import LEFT, RIGHT, Circle, Square, Star, Triangle, VMobject
+
+from toolkit import alignment
+
+
+def two_squares():
+    mob = VMobject()
+    mob.append_points(Square().shift(LEFT).points)
+    mob.append_points(Square(side_length=0.5).shift(RIGHT).points)
+    return mob
+
+
+PAIRS = {
+    "circle-square": (Circle, Square),
+    "square-triangle": (Square, Triangle),
+    "star-circle": (Star, Circle),
+    "two-subpaths-one": (two_squares, Triangle),
+    "one-two-subpaths": (Circle, two_squares),
+}
+
+
+@pytest.mark.parametrize("make_source, make_target", PAIRS.values(), ids=PAIRS.keys())
+def test_matches_manim(make_source, make_target):
+    # Twice: the second call reuses the plan built by the first
+    for _ in range(2):
+        source, target = make_source(), make_target()
+        expected_source, expected_target = source.copy(), target.copy()
+        alignment._manim_align_points(expected_source, expected_target)
+        alignment.align_points(source, target)
+        np.testing.assert_allclose(source.points, expected_source.points, atol=1e-12)
+        np.testing.assert_allclose(target.points, expected_target.points, atol=1e-12)
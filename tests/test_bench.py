@@ -0,0 +1,35 @@
+from toolkit.bench import compare
+
+
+def result(**overrides):
+    values = {"wall_seconds": 10.0, "fps": 30.0, "peak_rss_mb": 200.0, "play_seconds": [1.0, 2.0, 0.01]}
+    values.update(overrides)
+    return values
+
+
+def test_within_tolerance_passes():
+    assert compare({"a": result(wall_seconds=10.5)}, {"a": result()}, 0.1) == []
+
+
+def test_single_play_regression_fails():
+    failures = compare({"a": result(play_seconds=[1.0, 2.5, 0.01])}, {"a": result()}, 0.1)
+    assert len(failures) == 1
+    assert "play_seconds[1]" in failures[0]
+
+
+def test_tiny_plays_are_not_compared():
+    assert compare({"a": result(play_seconds=[1.0, 2.0, 0.03])}, {"a": result()}, 0.1) == []
+
+
+def test_changed_play_count_fails():
+    assert compare({"a": result(play_seconds=[1.0, 2.0])}, {"a": result()}, 0.1)
+
+
+def test_lower_fps_fails():
+    assert compare({"a": result(fps=20.0)}, {"a": result()}, 0.1)
+
+
+def test_metrics_missing_from_an_older_baseline_are_skipped():
+    old = result()
+    del old["play_seconds"], old["peak_rss_mb"]
+    assert compare({"a": result(play_seconds=[9.0])}, {"a": old}, 0.1) == []
@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+
+from toolkit.ensemble import walk_density
+
+
+@pytest.mark.parametrize("workers", [2, 3, 8])
+def test_worker_count_does_not_change_the_result(workers):
+    kwargs = dict(num_walks=5000, num_steps=40, y_max=15, x_bins=20, y_bins=16, seed=7, chunk_walks=300, block_steps=16)
+    serial = walk_density(workers=1, **kwargs)
+    np.testing.assert_array_equal(walk_density(workers=workers, **kwargs), serial)
+
+
+def test_every_step_of_every_walk_is_counted():
+    counts = walk_density(1000, 30, y_max=31, x_bins=31, y_bins=62, seed=1, workers=1, chunk_walks=128, block_steps=7)
+    assert counts.sum() == 1000 * 30
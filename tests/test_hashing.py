@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Dot, Square, VGroup
+
+from toolkit.hashing import mobject_digests
+
+
+def test_array_changed_in_place_inside_a_list_changes_the_digest():
+    mob = Square()
+    mob.anchors = [np.zeros(3), np.ones(3)]
+    before = mobject_digests([mob])[0]
+    mob.anchors[1][0] = 5.0
+    assert mobject_digests([mob])[0] != before
+
+
+def test_mobject_inside_a_dict_is_part_of_the_digest():
+    mob = Square()
+    marker = Dot()
+    mob.markers = {"corner": marker}
+    before = mobject_digests([mob])[0]
+    marker.shift([1, 0, 0])
+    assert mobject_digests([mob])[0] != before
+
+
+def test_unchanged_family_keeps_its_digest():
+    group = VGroup(Square(), Dot())
+    assert mobject_digests([group]) == mobject_digests([group])
@@ -0,0 +1,60 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+av = pytest.importorskip("av")
+
+from manim._config.video_encoder import VideoEncoderSpec
+from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+from toolkit.holds import HoldFrameEncoder
+
+RATE = Fraction(15)
+SPEC = VideoEncoderSpec("mp4", "libx264", "yuv420p", 64, 48, RATE, (("crf", "23"),))
+COLOURS = np.array([[255, 0, 0], [0, 255, 0], [0, 0, 255], [255, 255, 255]])
+# (colour index, repeat): single frames, holds and a hold at the very end
+SEQUENCE = [(0, 1), (1, 12), (2, 1), (3, 2), (0, 9)]
+
+
+def encode(encoder_class, target, mode=None):
+    if mode is not None:
+        encoder_class = type("Encoder", (encoder_class,), {"mode": mode})
+    encoder = encoder_class(target=target, spec=SPEC)
+    for colour, repeat in SEQUENCE:
+        pixels = np.empty((SPEC.height, SPEC.width, 4), dtype=np.uint8)
+        pixels[..., :3], pixels[..., 3] = COLOURS[colour], 255
+        encoder.write_frame(pixels, repeat=repeat)
+    encoder.finish()
+    return target
+
+
+def on_screen(path):
+    """Colour shown at every 1/RATE step of the video, and the video's length in seconds."""
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        frames = []
+        for frame in container.decode(stream):
+            mean = frame.to_ndarray(format="rgb24").reshape(-1, 3).mean(axis=0)
+            frames.append((frame.time, int(np.argmin(np.linalg.norm(COLOURS - mean, axis=1)))))
+        end = max(float((p.pts + p.duration) * stream.time_base) for p in container.demux(stream) if p.pts is not None)
+    total = sum(repeat for _, repeat in SEQUENCE)
+    shown = []
+    for i in range(total):
+        t = i / float(RATE) + 1e-6
+        shown.append([colour for time, colour in frames if time <= t][-1])
+    return shown, end
+
+
+@pytest.mark.parametrize("mode", ["vfr", "cfr"])
+def test_timing_matches_a_constant_rate_encode(tmp_path, mode):
+    expected, expected_end = on_screen(encode(VideoSegmentEncoder, tmp_path / "manim.mp4"))
+    shown, end = on_screen(encode(HoldFrameEncoder, tmp_path / f"{mode}.mp4", mode))
+    assert shown == expected == [colour for colour, repeat in SEQUENCE for _ in range(repeat)]
+    assert end == pytest.approx(expected_end)
+
+
+def test_vfr_writes_fewer_frames(tmp_path):
+    with av.open(str(encode(HoldFrameEncoder, tmp_path / "vfr.mp4", "vfr"))) as container:
+        assert sum(1 for _ in container.decode(video=0)) < sum(repeat for _, repeat in SEQUENCE)
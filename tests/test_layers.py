@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import DOWN, LEFT, RIGHT, UP, Dot, FadeToColor, Square, VGroup, RED
+from manim.utils.family import extract_mobject_family_members
+
+from toolkit.layers import LayeredScene
+
+
+class EmptyScene(LayeredScene):
+    def construct(self):
+        pass
+
+
+def drawn(mobjects):
+    # What the camera draws for a list: every member with points of every family
+    return set(extract_mobject_family_members(mobjects, only_those_with_points=True))
+
+
+def split(scene, *animations):
+    moving, static = scene.get_moving_and_static_mobjects(animations)
+    return drawn(moving), drawn(static)
+
+
+def test_grouped_still_mobjects_are_only_drawn_in_the_background():
+    scene = EmptyScene()
+    mover = Square(side_length=0.5).move_to(UP * 3)
+    left, right = Dot(LEFT * 5 + DOWN * 2), Dot(RIGHT * 5 + DOWN * 2)
+    # Added after the mover, so manim alone would redraw them every frame
+    scene.add(mover, VGroup(left, right))
+
+    moving, static = split(scene, FadeToColor(mover, RED))
+
+    assert not moving & static
+    assert {left, right} <= static
+    assert mover in moving
+
+
+def test_group_with_a_moving_member_splits_without_double_drawing():
+    scene = EmptyScene()
+    mover = Square(side_length=0.5).move_to(UP * 3)
+    near, far = Dot(UP * 3), Dot(LEFT * 5 + DOWN * 2)
+    scene.add(mover, VGroup(near, far))
+
+    moving, static = split(scene, FadeToColor(mover, RED))
+
+    assert not moving & static
+    assert near in moving
+    assert far in static
+
+
+def test_mobject_with_points_keeps_its_family_together():
+    scene = EmptyScene()
+    mover = Square(side_length=0.5).move_to(UP * 3)
+    parent = Square(side_length=0.5).move_to(LEFT * 5)
+    near, far = Dot(UP * 3), Dot(LEFT * 5 + DOWN * 2)
+    parent.add(near, far)
+    scene.add(mover, parent)
+
+    moving, static = split(scene, FadeToColor(mover, RED))
+
+    assert not moving & static
+    assert {parent, near, far} <= moving
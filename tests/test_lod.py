@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from toolkit.lod import decimate_polyline
+
+
+def walk(count, seed=0):
+    rng = np.random.default_rng(seed)
+    ys = np.concatenate([[0], np.cumsum(rng.choice([-1.0, 1.0], count))])
+    return np.column_stack([np.arange(count + 1, dtype=float), ys, np.zeros(count + 1)])
+
+
+def column_extremes(points, columns, x0, span):
+    column = np.minimum(((points[:, 0] - x0) / span * columns).astype(int), columns - 1)
+    return {c: (points[column == c, 1].min(), points[column == c, 1].max()) for c in np.unique(column)}
+
+
+@pytest.mark.parametrize("columns", [7, 50, 200])
+def test_keeps_every_column_min_and_max(columns):
+    points = walk(5000)
+    decimated = decimate_polyline(points, columns)
+    assert len(decimated) < len(points)
+    x0, span = points[0, 0], points[-1, 0] - points[0, 0]
+    assert column_extremes(decimated, columns, x0, span) == column_extremes(points, columns, x0, span)
+    # Endpoints and order are kept, and every kept corner is an original one
+    np.testing.assert_array_equal(decimated[[0, -1]], points[[0, -1]])
+    assert np.all(np.diff(decimated[:, 0]) > 0)
+    assert set(map(tuple, decimated)) <= set(map(tuple, points))
+
+
+def test_short_or_non_monotone_polylines_are_unchanged():
+    short = walk(30)
+    np.testing.assert_array_equal(decimate_polyline(short, 10), short)
+    backwards = walk(5000)[::-1]
+    np.testing.assert_array_equal(decimate_polyline(backwards, 7), backwards)
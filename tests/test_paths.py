@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import RIGHT, Circle, VMobject
+
+from toolkit.paths import ArcLengthTable, arc_length_table
+
+
+def zigzag(count, seed=0):
+    rng = np.random.default_rng(seed)
+    corners = np.zeros((count + 1, 3))
+    corners[:, 0] = np.arange(count + 1) * 0.1
+    corners[:, 1] = np.cumsum(rng.choice([-1.0, 1.0], count + 1)) * 0.1
+    path = VMobject()
+    path.set_points_as_corners(corners)
+    return path
+
+
+@pytest.mark.parametrize("path", [zigzag(50), Circle()], ids=["zigzag", "circle"])
+def test_matches_point_from_proportion(path):
+    table = ArcLengthTable(path.points)
+    for alpha in np.linspace(0, 1, 37):
+        np.testing.assert_allclose(table.point_from_proportion(alpha), path.point_from_proportion(alpha), atol=1e-9)
+
+
+def test_table_is_rebuilt_when_the_path_moves():
+    path = zigzag(20)
+    table = arc_length_table(path)
+    assert arc_length_table(path) is table
+    path.shift(RIGHT)
+    moved = arc_length_table(path)
+    assert moved is not table
+    np.testing.assert_allclose(moved.point_from_proportion(0.5), path.point_from_proportion(0.5), atol=1e-9)
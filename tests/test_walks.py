@@ -0,0 +1,39 @@
+from collections import Counter
+from itertools import accumulate, product
+
+import numpy as np
+import pytest
+
+from toolkit.walks import lattice_edges, stacked_opacity
+
+
+def enumerated_edges(num_steps):
+    """(step, y_start, y_end) -> number of the 2^num_steps paths along that edge."""
+    edges = Counter()
+    for moves in product((1, -1), repeat=num_steps):
+        heights = [0, *accumulate(moves)]
+        for k in range(num_steps):
+            edges[k, heights[k], heights[k + 1]] += 1
+    return edges
+
+
+@pytest.mark.parametrize("num_steps", range(1, 9))
+def test_lattice_edges_match_enumerated_paths(num_steps):
+    steps, y_starts, y_ends, counts = lattice_edges(num_steps)
+    edges = {(int(k), int(a), int(b)): c for k, a, b, c in zip(steps, y_starts, y_ends, counts)}
+    assert len(edges) == len(steps)
+    assert edges == enumerated_edges(num_steps)
+
+
+@pytest.mark.parametrize("num_steps", range(1, 7))
+def test_stacked_opacity_matches_drawing_every_path(num_steps):
+    opacity = 0.3
+    steps, y_starts, y_ends, counts = lattice_edges(num_steps)
+    stacked = stacked_opacity(counts, opacity)
+    for (k, a, b), count in enumerated_edges(num_steps).items():
+        # Alpha-composite one stroke per path on top of the others
+        alpha = 0.0
+        for _ in range(count):
+            alpha += opacity * (1 - alpha)
+        edge = np.flatnonzero((steps == k) & (y_starts == a) & (y_ends == b))
+        assert stacked[edge[0]] == pytest.approx(alpha)
@@ -0,0 +1 @@
+"""Shared helpers for the scenes in this repository."""
@@ -0,0 +1,154 @@
+"""Memoized point alignment for ``Transform`` between shapes.
+
+Before a ``Transform`` interpolates, ``VMobject.align_points`` gives source and
+target the same subpaths with the same number of curves, subdividing curves
+with ``bezier_remap``. Which curves are split, and into how many pieces, only
+depends on the curve counts of the subpaths; each new curve is a fixed linear
+combination of the four points of one original curve. `install` replaces
+``align_points`` with a version that keeps that plan (gather indices and 4x4
+weights per new curve) for every pair of subpath layouts it has seen, so
+repeated morphs between the same kinds of shapes only do one gather and one
+matrix product per side.
+
+The time spent in ``Transform.begin`` and the plans reused/built are logged
+when the render finishes.
+"""
+
+import atexit
+from dataclasses import dataclass
+from time import perf_counter
+
+import numpy as np
+from manim import Transform, VMobject, logger
+from manim.utils.bezier import subdivide_bezier
+
+NPPCC = 4
+
+
+@dataclass
+class AlignStats:
+    begins: int = 0
+    begin_seconds: float = 0.0
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.begins} Transform.begin calls in {self.begin_seconds * 1000:.1f} ms, "
+            f"{self.hits} alignment plans reused, {self.misses} built"
+        )
+
+
+stats = AlignStats()
+_installed = False
+_manim_align_points = VMobject.align_points
+_manim_transform_begin = Transform.begin
+# (subpath lengths of source, of target) -> (plan of source, plan of target)
+_plans = {}
+# split factor -> weights of the pieces of one subdivided curve
+_pieces = {}
+
+
+def _subpaths(mob, tolerance):
+    """(start, length) of every subpath of `mob`, as ``get_subpaths`` and ``align_points`` find them."""
+    points = mob.points
+    ends, starts = points[NPPCC - 1 : -1 : NPPCC], points[NPPCC::NPPCC]
+    breaks = NPPCC * (1 + np.flatnonzero(~np.all(np.isclose(ends, starts, atol=mob.tolerance_for_point_equality), axis=1)))
+    bounds = [0, *breaks.tolist(), len(points)]
+    subpaths = []
+    for start, stop in zip(bounds, bounds[1:]):
+        # Drop null curves at the end of the subpath, as align_points does
+        while stop - start > NPPCC and np.allclose(points[stop - NPPCC : stop], points[stop - NPPCC - 1], atol=tolerance):
+            stop -= NPPCC
+        subpaths.append((start, stop - start))
+    return subpaths
+
+
+def _piece_weights(split):
+    if split not in _pieces:
+        _pieces[split] = subdivide_bezier(np.eye(NPPCC), split).reshape(split, NPPCC, NPPCC)
+    return _pieces[split]
+
+
+def _side_plan(lengths, other_lengths):
+    """Gather indices (relative to each subpath's start, or -1 for the last point) and weights for one side."""
+    subpath_index, offsets, weights = [], [], []
+    for n in range(max(len(lengths), len(other_lengths))):
+        if n < len(lengths):
+            curves = lengths[n] // NPPCC
+            source = [(n, NPPCC * c) for c in range(curves)]
+        else:
+            # A null subpath at the last point
+            curves, source = 1, [(-1, 0)]
+        other = other_lengths[n] // NPPCC if n < len(other_lengths) else 1
+        new_curves = curves + max(0, other - curves)
+        repeat = np.arange(new_curves) * curves // new_curves
+        for (index, offset), split in zip(source, np.bincount(repeat, minlength=curves)):
+            subpath_index.extend([index] * split)
+            offsets.extend([offset] * split)
+            weights.append(_piece_weights(int(split)) if index >= 0 else np.tile(np.eye(NPPCC), (split, 1, 1)))
+    return np.array(subpath_index), np.array(offsets), np.concatenate(weights)
+
+
+def _apply(plan, mob, subpaths):
+    subpath_index, offsets, weights = plan
+    starts = np.array([start for start, _ in subpaths])
+    first = starts[np.maximum(subpath_index, 0)] + offsets
+    # Null subpaths repeat the very last point
+    gather = np.where(subpath_index[:, None] >= 0, first[:, None] + np.arange(NPPCC), len(mob.points) - 1)
+    return np.einsum("nij,njd->nid", weights, mob.points[gather]).reshape(-1, mob.dim)
+
+
+def align_points(self, vmobject):
+    """Drop-in for ``VMobject.align_points`` that reuses alignment plans."""
+    if len(self.points) % NPPCC or len(vmobject.points) % NPPCC:
+        return _manim_align_points(self, vmobject)
+    self.align_rgbas(vmobject)
+    if self.get_num_points() == vmobject.get_num_points():
+        return self
+    for mob in self, vmobject:
+        if mob.has_no_points():
+            mob.start_new_path(mob.get_center())
+        if mob.has_new_path_started():
+            mob.add_line_to(mob.get_last_point())
+
+    tolerance = self.tolerance_for_point_equality
+    subpaths1, subpaths2 = _subpaths(self, tolerance), _subpaths(vmobject, tolerance)
+    lengths1 = tuple(length for _, length in subpaths1)
+    lengths2 = tuple(length for _, length in subpaths2)
+    key = (lengths1, lengths2)
+    plans = _plans.get(key)
+    if plans is None:
+        stats.misses += 1
+        plans = _plans[key] = (_side_plan(lengths1, lengths2), _side_plan(lengths2, lengths1))
+    else:
+        stats.hits += 1
+    new_points1, new_points2 = _apply(plans[0], self, subpaths1), _apply(plans[1], vmobject, subpaths2)
+    self.set_points(new_points1)
+    vmobject.set_points(new_points2)
+    return self
+
+
+def _transform_begin(self):
+    start = perf_counter()
+    try:
+        _manim_transform_begin(self)
+    finally:
+        stats.begins += 1
+        stats.begin_seconds += perf_counter() - start
+
+
+def log_stats():
+    """Log the alignment stats of this process, if anything was transformed."""
+    if stats.begins:
+        logger.info("Alignment: %(s)s", {"s": str(stats)})
+
+
+def install(report=True):
+    """Use the memoized `align_points` (and time ``Transform.begin``) in this process."""
+    global _installed
+    VMobject.align_points = align_points
+    Transform.begin = _transform_begin
+    if report and not _installed:
+        atexit.register(log_stats)
+    _installed = True
@@ -0,0 +1,209 @@
+"""Render benchmarks for the scenes in this repository.
+
+Usage (from the repository root)::
+
+    python -m toolkit.bench                                  # run everything
+    python -m toolkit.bench -k randomwalk                    # names containing "randomwalk"
+    python -m toolkit.bench --save-baseline                  # store results as the new baseline
+    python -m toolkit.bench --baseline bench/baseline.json --tolerance 0.15
+
+Every benchmark renders one scene at a fixed seed and quality with caching
+off, in a fresh process. The results file records wall time, frames per second,
+the time of every ``play``/``wait`` call and peak RSS. When a baseline exists,
+any metric more than ``--tolerance`` worse than it fails the run, including
+the time of any single call (calls shorter than `MIN_PLAY_SECONDS` in both
+runs are too noisy to compare).
+"""
+
+import argparse
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from toolkit.render import REPO_ROOT, configure, create_scene
+from toolkit.walks import WalkParams
+
+BENCH_DIR = REPO_ROOT / "bench"
+SEED = 1234
+
+
+@dataclass
+class Benchmark:
+    name: str
+    file: str
+    scene: str
+    quality: str = "l"
+    # Extra environment for the render, e.g. RandomWalk parameters
+    env: dict = field(default_factory=dict)
+
+
+def _walk(**params):
+    return WalkParams(seed=SEED, **params).to_env()
+
+
+BENCHMARKS = [
+    Benchmark("randomwalk-l", "randomwalk.py", "RandomWalk", env=_walk()),
+    Benchmark("randomwalk-h", "randomwalk.py", "RandomWalk", quality="h", env=_walk()),
+    Benchmark("randomwalk-deep-tree", "randomwalk.py", "RandomWalk", env=_walk(num_steps=12)),
+    Benchmark("randomwalk-long-walk", "randomwalk.py", "RandomWalk", env=_walk(additional_steps=1_000_000)),
+    Benchmark("randomwalk-ensemble", "randomwalk.py", "RandomWalk", env=_walk(ensemble_walks=100_000)),
+    Benchmark("righttriangle-l", "pythagorean.py", "righttriangle"),
+    Benchmark("righttriangle-h", "pythagorean.py", "righttriangle", quality="h"),
+    Benchmark("stickperson-l", "learning.py", "StickPerson"),
+    Benchmark("simpledemo-l", "scenes/demo_latex.py", "SimpleDemo"),
+]
+
+# metric -> True when larger is better; list metrics are compared item by item
+METRICS = {"wall_seconds": False, "fps": True, "peak_rss_mb": False, "play_seconds": False}
+# Calls faster than this in both runs aren't compared
+MIN_PLAY_SECONDS = 0.05
+
+
+def run_in_process(benchmark):
+    """Render `benchmark` in this process and return its measurements."""
+    os.environ.update(benchmark.env)
+    path = REPO_ROOT / benchmark.file
+    configure(path, benchmark.quality, disable_caching=True, output_file=f"bench_{benchmark.name}")
+    start = time.perf_counter()
+    scene = create_scene(path, benchmark.scene, SEED)
+    renderer = scene.renderer
+    play_seconds, frames = [], [0]
+    renderer_play, renderer_add_frame = renderer.play, renderer.add_frame
+
+    def play(*args, **kwargs):
+        play_start = time.perf_counter()
+        renderer_play(*args, **kwargs)
+        play_seconds.append(time.perf_counter() - play_start)
+
+    def add_frame(frame, num_frames=1):
+        frames[0] += num_frames
+        renderer_add_frame(frame, num_frames)
+
+    renderer.play, renderer.add_frame = play, add_frame
+    scene.render()
+    wall = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux; worker pools (the ensemble) count as children
+    peak_kib = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return {
+        "wall_seconds": wall,
+        "frames": frames[0],
+        "fps": frames[0] / wall if wall else 0.0,
+        "play_seconds": play_seconds,
+        "peak_rss_mb": peak_kib / 1024,
+    }
+
+
+def run(benchmark):
+    """Run `benchmark` in a fresh process so timings and peak RSS are its own."""
+    with tempfile.TemporaryDirectory() as tmp:
+        result_file = Path(tmp) / "result.json"
+        command = [sys.executable, "-m", "toolkit.bench", "--child", json.dumps(asdict(benchmark)), "--child-output", str(result_file)]
+        completed = subprocess.run(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            return {"error": completed.stderr.strip().splitlines()[-1:] or [f"exit code {completed.returncode}"]}
+        return json.loads(result_file.read_text())
+
+
+def compare(results, baseline, tolerance):
+    """Messages for every metric in `results` that is worse than `baseline` by more than `tolerance`."""
+    failures = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or "error" in base:
+            continue
+        if "error" in result:
+            failures.append(f"{name}: failed ({result['error'][0]})")
+            continue
+        for metric, larger_is_better in METRICS.items():
+            # Baselines saved before a metric was added don't have it
+            if metric not in base or metric not in result:
+                continue
+            old, new = base[metric], result[metric]
+            if isinstance(old, list):
+                if len(old) != len(new):
+                    failures.append(f"{name}: {len(old)} {metric} -> {len(new)}; save a new baseline")
+                    continue
+                for i, (old_item, new_item) in enumerate(zip(old, new)):
+                    if max(old_item, new_item) >= MIN_PLAY_SECONDS:
+                        failures.extend(_regression(f"{name}: {metric}[{i}]", old_item, new_item, larger_is_better, tolerance))
+            else:
+                failures.extend(_regression(f"{name}: {metric}", old, new, larger_is_better, tolerance))
+    return failures
+
+
+def _regression(label, old, new, larger_is_better, tolerance):
+    if not old:
+        return []
+    change = (new - old) / old
+    if (-change if larger_is_better else change) > tolerance:
+        return [f"{label} {old:.3g} -> {new:.3g} ({change:+.0%})"]
+    return []
+
+
+def format_results(results):
+    width = max([len(name) for name in results] + [len("benchmark")])
+    lines = [f"{'benchmark':<{width}}  {'seconds':>8}  {'frames':>7}  {'fps':>7}  {'slowest play':>12}  {'peak MB':>8}"]
+    for name, r in results.items():
+        if "error" in r:
+            lines.append(f"{name:<{width}}  failed: {r['error'][0]}")
+            continue
+        slowest = max(r["play_seconds"], default=0.0)
+        lines.append(f"{name:<{width}}  {r['wall_seconds']:>8.2f}  {r['frames']:>7}  {r['fps']:>7.1f}  {slowest:>12.2f}  {r['peak_rss_mb']:>8.0f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m toolkit.bench", description="Benchmark scene renders")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("-o", "--output", default=str(BENCH_DIR / "results.json"), help="results file")
+    parser.add_argument("--baseline", default=str(BENCH_DIR / "baseline.json"), help="baseline to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative regression (default: 0.10)")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to the baseline file too")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--child-output", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        result = run_in_process(Benchmark(**json.loads(args.child)))
+        Path(args.child_output).write_text(json.dumps(result))
+        return 0
+
+    benchmarks = [b for b in BENCHMARKS if args.filter in b.name]
+    if args.list:
+        for b in benchmarks:
+            print(f"{b.name}: {b.file} {b.scene} -q{b.quality} {' '.join(f'{k}={v}' for k, v in b.env.items())}")
+        return 0
+
+    results = {}
+    for benchmark in benchmarks:
+        print(f"running {benchmark.name}...", flush=True)
+        results[benchmark.name] = run(benchmark)
+    print(format_results(results))
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    baseline_file = Path(args.baseline)
+    if args.save_baseline:
+        baseline_file.write_text(json.dumps(results, indent=2))
+        print(f"baseline saved to {baseline_file}")
+        return 0
+    if not baseline_file.exists():
+        print(f"no baseline at {baseline_file}; run with --save-baseline to create one")
+        return 0
+
+    failures = compare(results, json.loads(baseline_file.read_text()), args.tolerance)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""Array versions of the coordinate helpers on manim's axes."""
+
+import numpy as np
+
+
+def axes_points(axes, xs, ys):
+    """Map whole arrays of axis coordinates to scene points in one call.
+
+    Returns an (n, 3) array, ready for ``set_points_as_corners``.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.broadcast_to(np.asarray(ys, dtype=float), xs.shape)
+    # c2p takes ([x0, x1, ...], [y0, y1, ...]) and answers with one row per axis
+    return np.asarray(axes.c2p(xs, ys)).reshape(3, -1).T
+
+
+def tick_step(span, count=10):
+    """Largest 1, 2 or 5 times a power of ten that puts at least `count` ticks on `span`."""
+    raw = span / count
+    magnitude = 10 ** np.floor(np.log10(raw))
+    step = max(m * magnitude for m in (1, 2, 5) if m * magnitude <= raw)
+    return int(step) if step >= 1 else float(step)
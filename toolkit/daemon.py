@@ -0,0 +1,208 @@
+"""A long-lived render server that keeps manim imported between renders.
+
+Usage (from the repository root)::
+
+    python -m toolkit.daemon serve &                             # once per session
+    python -m toolkit.daemon render scenes/demo_latex.py SimpleDemo -q l -p
+    python -m toolkit.daemon watch pythagorean.py righttriangle  # render again on every save
+
+Starting Python and importing manim (numpy, cairo, pango, PyAV, ...) takes
+longer than rendering a small scene. The server does that once. For every
+request it forks a copy of itself that imports the scene file fresh, renders
+and replies with the path of the video, so renders never see each other's
+state or a stale version of the file. ``toolkit.render`` (and so the
+``python <file>.py`` launchers) sends plain renders to the server when one is
+running.
+
+The client only uses the standard library and starts in a few milliseconds.
+"""
+
+import argparse
+import atexit
+import json
+import os
+from pathlib import Path
+import socket
+import socketserver
+import sys
+import time
+import traceback
+
+from toolkit.render import REPO_ROOT
+
+SOCKET = REPO_ROOT / "media" / "render.sock"
+# Environment the client passes on, so renders see e.g. the RandomWalk parameters
+FORWARDED_ENV = ("RANDOMWALK_", "HOLD_FRAMES")
+# Modules whose `log_stats` runs at exit; request processes leave with os._exit
+REPORTING_MODULES = ("toolkit.hashing", "toolkit.alignment", "toolkit.text_cache")
+# Polling interval of `watch`, in seconds
+WATCH_INTERVAL = 0.2
+
+
+def preload():
+    """Import everything a render needs that doesn't change between renders."""
+    import manim  # noqa: F401  (numpy, cairo, manimpango, av and scipy with it)
+    import manimpango
+
+    # Font discovery happens on the first Text otherwise
+    manimpango.list_fonts()
+
+
+def render_request(request):
+    """Render the scene described by `request` in this process; returns the video path."""
+    from toolkit.render import configure, create_scene
+
+    os.environ.update(request.get("env", {}))
+    configure(request["file"], request.get("quality", "l"), **request.get("config", {}))
+    try:
+        scene = create_scene(request["file"], request["scene"])
+        scene.render(preview=request.get("preview", False))
+    finally:
+        log_stats()
+    return scene.renderer.file_writer.movie_file_path
+
+
+def log_stats():
+    """Log the stats the toolkit modules in use would report at exit, and don't report them again."""
+    for name in REPORTING_MODULES:
+        module = sys.modules.get(name)
+        if module is not None:
+            module.log_stats()
+            atexit.unregister(module.log_stats)
+
+
+class RenderHandler(socketserver.StreamRequestHandler):
+    """Handles one request, in a process forked from the server."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # `available` connecting to check the server is up
+            return
+        request = json.loads(line)
+        start = time.perf_counter()
+        try:
+            output = render_request(request)
+            response = {"ok": True, "output": str(output)}
+        except Exception as error:
+            traceback.print_exc()
+            response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+        response["seconds"] = time.perf_counter() - start
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class RenderServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    pass
+
+
+def serve(socket_path=SOCKET):
+    start = time.perf_counter()
+    os.chdir(REPO_ROOT)
+    preload()
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if available(socket_path):
+        raise RuntimeError(f"a render server is already listening on {socket_path}")
+    socket_path.unlink(missing_ok=True)
+    with RenderServer(str(socket_path), RenderHandler) as server:
+        print(f"render server ready in {time.perf_counter() - start:.1f}s on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def available(socket_path=SOCKET):
+    """Whether a render server is listening on `socket_path`."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def request_render(file, scene, quality="l", preview=False, socket_path=SOCKET, **config):
+    """Ask the server to render `scene` from `file`; returns its response dict."""
+    request = {
+        "file": str(Path(file).resolve()),
+        "scene": scene,
+        "quality": quality,
+        "preview": preview,
+        "config": config,
+        "env": {k: v for k, v in os.environ.items() if k.startswith(FORWARDED_ENV)},
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as reply:
+            line = reply.readline()
+    if not line:
+        return {"ok": False, "error": "the render process exited without replying (see the server output)"}
+    return json.loads(line)
+
+
+def _report(response, start):
+    overhead = time.perf_counter() - start - response.get("seconds", 0.0)
+    if response["ok"]:
+        print(f"{response['output']} in {response['seconds']:.2f}s (+{overhead:.2f}s overhead)", flush=True)
+    else:
+        print(f"failed: {response['error']}", flush=True)
+    return response["ok"]
+
+
+def _sources(file):
+    """The files whose changes `watch` reacts to: the scene file and the toolkit."""
+    return [Path(file), *sorted((REPO_ROOT / "toolkit").glob("*.py"))]
+
+
+def watch(file, scene, quality="l", socket_path=SOCKET):
+    """Render `scene` now and again every time its file (or the toolkit) is saved."""
+    seen = None
+    while True:
+        try:
+            stamps = [path.stat().st_mtime_ns for path in _sources(file)]
+        except FileNotFoundError:
+            # Editors that save by replacing the file
+            stamps = seen
+        if stamps != seen:
+            seen = stamps
+            start = time.perf_counter()
+            _report(request_render(file, scene, quality, socket_path=socket_path), start)
+        time.sleep(WATCH_INTERVAL)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m toolkit.daemon", description="Render server with manim preloaded")
+    parser.add_argument("--socket", default=str(SOCKET), help=f"socket path (default: {SOCKET.relative_to(REPO_ROOT)})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="start the server")
+    for name in ("render", "watch"):
+        command = commands.add_parser(name, help=f"{name} a scene through the server")
+        command.add_argument("file", help="scene file")
+        command.add_argument("scene", help="scene class name")
+        command.add_argument("-q", "--quality", default="l", choices="lmhpk", help="manim quality flag (default: l)")
+        if name == "render":
+            command.add_argument("-p", "--preview", action="store_true", help="open the video when it is done")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+    if not available(args.socket):
+        print(f"no render server on {args.socket}; start one with python -m toolkit.daemon serve")
+        return 1
+    if args.command == "watch":
+        try:
+            watch(args.file, args.scene, args.quality, args.socket)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    start = time.perf_counter()
+    return 0 if _report(request_render(args.file, args.scene, args.quality, args.preview, args.socket), start) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
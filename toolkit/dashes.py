@@ -0,0 +1,50 @@
+"""Dashed lines drawn with Cairo's own dash patterns.
+
+``DashedLine`` cuts the line into one submobject per dash, each created,
+styled, hashed and stroked separately. `NativeDashedLine` stays a single
+``Line`` with a ``dash_pattern`` attribute, and `DashedCamera` hands that
+pattern to Cairo when stroking it. Pass the camera to the scene::
+
+    class MyScene(Scene):
+        def __init__(self, **kwargs):
+            super().__init__(camera_class=DashedCamera, **kwargs)
+
+``Create`` reveals the line from its start and Cairo dashes whatever part is
+visible, so it still draws dash by dash.
+"""
+
+import numpy as np
+from manim import DEFAULT_DASH_LENGTH, Camera, Line
+
+
+class NativeDashedLine(Line):
+    """A ``Line`` with the same dashes as ``DashedLine(..., dash_length, dashed_ratio)``.
+
+    The pattern is in scene units and fixed when the line is made; it is
+    rescaled along with `scale`.
+    """
+
+    def __init__(self, *args, dash_length=DEFAULT_DASH_LENGTH, dashed_ratio=0.5, **kwargs):
+        self.dash_length = dash_length
+        self.dashed_ratio = dashed_ratio
+        super().__init__(*args, **kwargs)
+        length = self.get_length()
+        # As DashedLine: at least two dashes, starting and ending on a dash
+        num_dashes = max(2, int(np.ceil(length / dash_length * dashed_ratio)))
+        self.dash_pattern = np.array([dashed_ratio * length / num_dashes, (1 - dashed_ratio) * length / (num_dashes - 1)])
+
+    def scale(self, scale_factor, **kwargs):
+        super().scale(scale_factor, **kwargs)
+        if hasattr(self, "dash_pattern"):
+            self.dash_pattern = self.dash_pattern * abs(scale_factor)
+        return self
+
+
+class DashedCamera(Camera):
+    """Cairo camera that strokes mobjects with a ``dash_pattern`` dashed."""
+
+    def apply_stroke(self, ctx, vmobject, background=False):
+        pattern = getattr(vmobject, "dash_pattern", None)
+        # The context is reused for every mobject and frame, so always reset it
+        ctx.set_dash([] if pattern is None else [float(d) for d in pattern])
+        return super().apply_stroke(ctx, vmobject, background)
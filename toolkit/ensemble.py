@@ -0,0 +1,99 @@
+"""Monte Carlo ensembles of +-1 random walks, accumulated into a density histogram.
+
+This module only depends on NumPy so that process pool workers start quickly.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import os
+
+import numpy as np
+
+# Chunks submitted per worker at a time; finished histograms are added up and dropped
+IN_FLIGHT_PER_WORKER = 2
+
+
+def _simulate_chunk(seed, num_walks, num_steps, y_max, x_bins, y_bins, block_steps):
+    """Histogram of the positions of `num_walks` walks, built a block of steps at a time."""
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(x_bins * y_bins, dtype=np.int64)
+    positions = np.zeros(num_walks, dtype=np.int32)
+    for start in range(0, num_steps, block_steps):
+        count = min(block_steps, num_steps - start)
+        steps = rng.integers(0, 2, size=(num_walks, count), dtype=np.int8) * np.int8(2) - np.int8(1)
+        heights = positions[:, None] + np.cumsum(steps, axis=1, dtype=np.int32)
+        positions = heights[:, -1].copy()
+
+        # Step t (1-based) lands in column t * x_bins // (num_steps + 1)
+        columns = np.arange(start + 1, start + count + 1) * x_bins // (num_steps + 1)
+        rows = np.floor((heights + y_max) / (2 * y_max) * y_bins).astype(np.int64)
+        inside = (rows >= 0) & (rows < y_bins)
+        flat = (columns[None, :] * y_bins + rows)[inside]
+        counts += np.bincount(flat, minlength=x_bins * y_bins)
+    return counts
+
+
+def walk_density(
+    num_walks,
+    num_steps,
+    y_max,
+    x_bins=400,
+    y_bins=200,
+    seed=None,
+    workers=None,
+    chunk_walks=2048,
+    block_steps=1024,
+):
+    """Simulate `num_walks` walks of `num_steps` steps and bin every visited position.
+
+    Walks are simulated in chunks of `chunk_walks` across a process pool, each
+    chunk streaming through its steps `block_steps` at a time, so memory stays
+    bounded by the chunk size whatever the ensemble size: only a few chunks per
+    worker are in flight, and each histogram is added to the total as soon as
+    it comes back. Returns the
+    ``(x_bins, y_bins)`` count array; column ``i`` covers steps
+    ``[i, i + 1) * (num_steps + 1) / x_bins`` and the rows split
+    ``[-y_max, y_max]`` evenly. Positions outside that range are dropped.
+    """
+    chunks = [min(chunk_walks, num_walks - start) for start in range(0, num_walks, chunk_walks)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    args = (num_steps, y_max, x_bins, y_bins, block_steps)
+
+    counts = np.zeros(x_bins * y_bins, dtype=np.int64)
+    if workers <= 1:
+        for chunk_seed, size in zip(seeds, chunks):
+            counts += _simulate_chunk(chunk_seed, size, *args)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            for chunk_seed, size in zip(seeds, chunks):
+                if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        counts += future.result()
+                pending.add(pool.submit(_simulate_chunk, chunk_seed, size, *args))
+            for future in pending:
+                counts += future.result()
+    return counts.reshape(x_bins, y_bins)
+
+
+def density_quantiles(counts, y_max, quantiles):
+    """Empirical quantiles of the binned heights in every column of `counts`.
+
+    Returns one array of heights (bin centres) per requested quantile, with
+    NaN for columns that saw no positions.
+    """
+    y_bins = counts.shape[1]
+    centres = -y_max + (np.arange(y_bins) + 0.5) * (2 * y_max / y_bins)
+    cumulative = np.cumsum(counts, axis=1)
+    totals = cumulative[:, -1]
+    result = []
+    for q in quantiles:
+        rows = np.argmax(cumulative >= q * totals[:, None], axis=1)
+        result.append(np.where(totals > 0, centres[rows], np.nan))
+    return result
+
+
+def column_centres(num_steps, x_bins):
+    """Step index at the middle of every histogram column."""
+    return (np.arange(x_bins) + 0.5) * (num_steps + 1) / x_bins
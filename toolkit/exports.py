@@ -0,0 +1,112 @@
+"""Lower-quality copies of a rendered scene without rendering it again.
+
+Usage (from the repository root)::
+
+    python -m toolkit.render pythagorean.py -q h --export l      # final and preview together
+    python -m toolkit.exports pythagorean.py righttriangle -q k --export lh
+
+The scene is rasterized once, at the highest quality asked for, and encoded
+losslessly (H.264 with ``crf=0``) into a master, ``<Scene>_lossless.mp4``.
+Every quality, the highest included, is then resampled from that master
+(scaled down and re-timed to its frame rate) in its own worker process and
+written where ``manim -q<flag>`` would put it:
+``media/videos/<file>/<resolution>/<Scene>.mp4``. So each video goes through
+one lossy encode, as a direct render would, instead of being re-encoded from
+an already compressed one. The cost is the extra encode of the highest
+quality and the master's disk space; it is kept, so ``--skip-render`` can
+export from it later.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+import sys
+
+from toolkit.render import QUALITIES, REPO_ROOT, SceneJob, render_job
+
+# Quality flags from lowest to highest
+ORDER = "lmhpk"
+# manim options for the master render: lossless H.264
+LOSSLESS_ARGS = ("--encoder-option", "crf=0")
+
+
+def highest(flags):
+    return max(flags, key=ORDER.index)
+
+
+def resolution_dir(flag):
+    """The ``<height>p<fps>`` directory manim uses for the quality `flag`."""
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    quality = MANIM_QUALITIES[QUALITIES[flag]]
+    return f"{quality['pixel_height']}p{quality['frame_rate']:g}"
+
+
+def video_path(path, scene, flag, media_dir=REPO_ROOT / "media"):
+    """Where ``manim -q<flag>`` writes the video of `scene` from the file `path`."""
+    return Path(media_dir) / "videos" / Path(path).stem / resolution_dir(flag) / f"{scene}.mp4"
+
+
+def master_path(path, scene, flag, media_dir=REPO_ROOT / "media"):
+    """The lossless master of `scene` rendered at the quality `flag`."""
+    video = video_path(path, scene, flag, media_dir)
+    return video.with_name(f"{video.stem}_lossless{video.suffix}")
+
+
+def export(source, target, flag):
+    """Resample the video `source` to the size and frame rate of the quality `flag`."""
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    from toolkit.video import retime
+
+    quality = MANIM_QUALITIES[QUALITIES[flag]]
+    return retime(source, target, quality["pixel_width"], quality["pixel_height"], quality["frame_rate"])
+
+
+def export_scene(pool, path, scene, rendered, flags, lossless=True):
+    """Submit one `export` per quality in `flags` from the `rendered` quality; returns the futures.
+
+    With `lossless`, the video just rendered with `LOSSLESS_ARGS` becomes the
+    master and every quality in `flags` is encoded from it. Otherwise the
+    existing master is used if there is one, else the rendered video itself,
+    which then means a second lossy encode for the other qualities.
+    """
+    master = master_path(path, scene, rendered)
+    if lossless:
+        os.replace(video_path(path, scene, rendered), master)
+    elif not master.exists():
+        master = video_path(path, scene, rendered)
+    return [
+        pool.submit(export, master, video_path(path, scene, flag), flag)
+        for flag in flags
+        if flag != rendered or master != video_path(path, scene, rendered)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m toolkit.exports", description="Render a scene once and export other qualities")
+    parser.add_argument("file", help="scene file")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-q", "--quality", default="h", choices="lmhpk", help="quality to render at (default: h)")
+    parser.add_argument("--export", default="l", help="qualities to produce from it, e.g. lm (default: l)")
+    parser.add_argument("--skip-render", action="store_true", help="only export from an existing render")
+    args, manim_args = parser.parse_known_args(argv)
+    if set(args.export) - set(ORDER):
+        parser.error(f"--export takes quality flags from {ORDER}")
+
+    rendered = highest(args.quality + args.export)
+    if not args.skip_render:
+        result = render_job(SceneJob(Path(args.file).resolve(), args.scene), rendered, [*manim_args, *LOSSLESS_ARGS])
+        if not result.ok:
+            print(f"render failed, see {result.log_file}")
+            return 1
+    flags = set(args.export + args.quality)
+    with ProcessPoolExecutor(len(flags)) as pool:
+        for future in export_scene(pool, args.file, args.scene, rendered, flags, lossless=not args.skip_render):
+            print(f"written {future.result()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
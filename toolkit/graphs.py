@@ -0,0 +1,77 @@
+"""Graphs of NumPy functions, sampled adaptively in one array pass."""
+
+from manim import PI, VMobject
+import numpy as np
+
+from toolkit.coords import axes_points
+
+
+def adaptive_samples(axes, func, x_range, max_turn=PI / 90, dense=2049):
+    """Sample `func` over `x_range` where the graph actually bends.
+
+    `func` is called once on a dense array of x values (it must accept arrays,
+    like ``np.sqrt`` or ``lambda x: -x``). Samples are then kept so that the
+    direction of the on-screen curve turns by at most about `max_turn` radians
+    between consecutive ones: straight stretches keep only their end points,
+    tight bends keep many. Returns the kept ``(xs, ys)``.
+    """
+    x_min, x_max = x_range[0], x_range[1]
+    # A few extra samples crowd each end, where curves like sqrt bend sharply
+    ends = np.geomspace(1e-6, 1 / (dense - 1), 16)
+    fractions = np.unique(np.concatenate([np.linspace(0, 1, dense), ends, 1 - ends]))
+    xs = x_min + (x_max - x_min) * fractions
+    ys = np.broadcast_to(np.asarray(func(xs), dtype=float), xs.shape)
+    finite = np.isfinite(ys)
+    xs, ys = xs[finite], ys[finite]
+    if len(xs) <= 2:
+        return xs, ys
+
+    chords = np.diff(axes_points(axes, xs, ys), axis=0)
+    headings = np.unwrap(np.arctan2(chords[:, 1], chords[:, 0]))
+    # Turning accumulated up to each interior sample, in units of max_turn
+    turning = np.concatenate([[0], np.cumsum(np.abs(np.diff(headings))) / max_turn])
+    budget = np.floor(turning).astype(np.int64)
+    keep = np.flatnonzero(np.diff(budget, prepend=-1))
+    keep = np.union1d(keep, [0, len(xs) - 1])
+    return xs[keep], ys[keep]
+
+
+def _curve_proportion(xs, alpha):
+    """Proportion of the corner path through `xs` that reaches `alpha` of the x range."""
+    target = xs[0] + alpha * (xs[-1] - xs[0])
+    i = int(np.clip(np.searchsorted(xs, target, side="right") - 1, 0, len(xs) - 2))
+    residue = np.clip((target - xs[i]) / (xs[i + 1] - xs[i]), 0, 1)
+    return (i + residue) / (len(xs) - 1)
+
+
+class VectorizedGraph(VMobject):
+    """Graph of a vectorized `func` on `axes`, drawn through adaptively placed corners.
+
+    A drop-in for ``axes.plot(lambda x: ..., x_range=...)`` when `func` works on
+    arrays. The sample coordinates are kept as ``xs``/``ys`` and the scene points
+    as ``corners`` so other mobjects, like :class:`AreaBetween`, can reuse them.
+    """
+
+    def __init__(self, axes, func, x_range, max_turn=PI / 90, **kwargs):
+        super().__init__(**kwargs)
+        self.underlying_function = func
+        self.xs, self.ys = adaptive_samples(axes, func, x_range, max_turn)
+        self.corners = axes_points(axes, self.xs, self.ys)
+        self.set_points_as_corners(self.corners)
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        # Reveal by x rather than by curve count, so that samples crowding
+        # into a bend do not slow Create down there
+        xs = getattr(vmobject, "xs", None)
+        if xs is None or len(xs) != vmobject.get_num_curves() + 1 or xs[-1] == xs[0]:
+            return super().pointwise_become_partial(vmobject, a, b)
+        return super().pointwise_become_partial(vmobject, _curve_proportion(xs, a), _curve_proportion(xs, b))
+
+
+class AreaBetween(VMobject):
+    """Closed region between two :class:`VectorizedGraph` curves, built from their corners."""
+
+    def __init__(self, upper, lower, **kwargs):
+        super().__init__(**kwargs)
+        outline = np.concatenate([upper.corners[::-1], lower.corners])
+        self.set_points_as_corners(np.concatenate([outline, outline[:1]]))
@@ -0,0 +1,209 @@
+"""Incremental play hashing for manim's partial-movie cache.
+
+Manim keys each cached partial movie on a JSON dump of the camera, the
+animations and every mobject on screen, rebuilt from scratch on every ``play``.
+`install` swaps in a hash that keeps a digest per mobject. Before each play a
+cheap probe (a CRC of the mobject's arrays, also inside lists and dicts, plus
+its plain attributes) tells
+which mobjects changed since they were last hashed; only those are hashed
+again, everything else reuses its digest.
+
+Digests only depend on content, so unchanged plays keep their keys across runs
+and editing one step of a scene re-renders just that step.
+"""
+
+import atexit
+from dataclasses import dataclass
+import hashlib
+from time import perf_counter
+from weakref import WeakKeyDictionary
+import zlib
+
+import numpy as np
+from manim import Mobject, logger
+from manim.renderer import cairo_renderer
+from manim.utils.hashing import KEYS_TO_FILTER_OUT, _get_json, _Memoizer
+
+# Bump when the digest layout changes so old partial movies aren't reused
+HASH_VERSION = 2
+SCALARS = (str, int, float, bool, type(None))
+
+
+@dataclass
+class HashStats:
+    plays: int = 0
+    hits: int = 0
+    misses: int = 0
+    seconds: float = 0.0
+
+    def __str__(self):
+        return (
+            f"{self.plays} plays hashed in {self.seconds * 1000:.1f} ms, "
+            f"{self.hits} mobject digests reused, {self.misses} recomputed"
+        )
+
+
+stats = HashStats()
+_installed = False
+# mobject -> (probe, digest of its own attributes)
+_digests = WeakKeyDictionary()
+
+
+def _probe_value(value, seen=None):
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.dtype.str, zlib.crc32(np.ascontiguousarray(value)))
+    if isinstance(value, SCALARS):
+        return value
+    if isinstance(value, (list, tuple, dict)):
+        # Contents can change in place, so probe them like top-level values
+        seen = set() if seen is None else seen
+        if id(value) in seen:
+            return "cycle"
+        seen.add(id(value))
+        if isinstance(value, dict):
+            return tuple((k, _probe_value(v, seen)) for k, v in value.items())
+        return tuple(_probe_value(v, seen) for v in value)
+    # Mobjects count through their own digests (see `_mobject_refs`); other
+    # objects (colours, functions) are replaced rather than changed in place
+    return id(value)
+
+
+def _nested_mobjects(value, seen):
+    if isinstance(value, Mobject):
+        yield value
+    elif isinstance(value, (list, tuple, dict)) and id(value) not in seen:
+        seen.add(id(value))
+        for item in value.values() if isinstance(value, dict) else value:
+            yield from _nested_mobjects(item, seen)
+
+
+def _mobject_refs(mob):
+    """Mobjects that `mob` refers to through attributes other than its submobjects."""
+    seen = set()
+    for key, value in mob.__dict__.items():
+        if key != "submobjects":
+            yield from _nested_mobjects(value, seen)
+
+
+def _probe(mob):
+    """Cheap fingerprint of the attributes of `mob` itself, valid within one run."""
+    return tuple((key, _probe_value(value)) for key, value in mob.__dict__.items() if key not in KEYS_TO_FILTER_OUT)
+
+
+class _Hasher:
+    """Digests for one play call; mobjects are looked up in the cross-play cache."""
+
+    def __init__(self):
+        self.family_digests = {}
+        self.in_progress = set()
+        # While hashing a mobject's own attributes, referenced mobjects are
+        # left out; `family` mixes in their current digests instead.
+        self.shallow = False
+
+    def value(self, value, digest):
+        if isinstance(value, Mobject):
+            digest.update(b"mobject" if self.shallow else self.family(value))
+        elif isinstance(value, np.ndarray):
+            digest.update(f"{value.dtype.str}{value.shape}".encode())
+            digest.update(np.ascontiguousarray(value))
+        elif isinstance(value, SCALARS):
+            digest.update(repr(value).encode())
+        elif isinstance(value, (list, tuple)):
+            digest.update(f"[{len(value)}".encode())
+            for item in value:
+                self.value(item, digest)
+            digest.update(b"]")
+        elif isinstance(value, dict):
+            digest.update(f"{{{len(value)}".encode())
+            for key, item in value.items():
+                self.value(key, digest)
+                self.value(item, digest)
+            digest.update(b"}")
+        elif hasattr(value, "__dict__") and not callable(value) and id(value) not in self.in_progress:
+            digest.update(type(value).__qualname__.encode())
+            self.in_progress.add(id(value))
+            self.attributes(value, digest)
+            self.in_progress.discard(id(value))
+        else:
+            # Functions, colours and the like: manim's own serializer
+            digest.update(_get_json(value, _Memoizer()).encode())
+
+    def attributes(self, obj, digest, skip=()):
+        for key in sorted(obj.__dict__):
+            if key in KEYS_TO_FILTER_OUT or key in skip:
+                continue
+            digest.update(key.encode())
+            self.value(obj.__dict__[key], digest)
+
+    def own(self, mob):
+        """Digest of the attributes of `mob` without its submobjects, cached across plays."""
+        probe = _probe(mob)
+        cached = _digests.get(mob)
+        if cached is not None and cached[0] == probe:
+            stats.hits += 1
+            return cached[1]
+        stats.misses += 1
+        digest = hashlib.blake2b(type(mob).__qualname__.encode(), digest_size=16)
+        digest.update(str(len(mob.submobjects)).encode())
+        self.shallow = True
+        self.attributes(mob, digest, skip=("submobjects",))
+        self.shallow = False
+        _digests[mob] = (probe, digest.digest())
+        return _digests[mob][1]
+
+    def family(self, mob):
+        key = id(mob)
+        if key in self.family_digests:
+            return self.family_digests[key]
+        if key in self.in_progress:
+            # A mobject referring back to one of its ancestors
+            return b"cycle"
+        self.in_progress.add(key)
+        digest = hashlib.blake2b(self.own(mob), digest_size=16)
+        for sub in mob.submobjects:
+            digest.update(self.family(sub))
+        for ref in _mobject_refs(mob):
+            digest.update(self.family(ref))
+        self.in_progress.discard(key)
+        self.family_digests[key] = digest.digest()
+        return self.family_digests[key]
+
+
+def mobject_digests(mobjects):
+    """Content digests of `mobjects` and their families, reusing cached per-mobject digests."""
+    hasher = _Hasher()
+    return [hasher.family(mob) for mob in mobjects]
+
+
+def get_hash_from_play_call(scene, camera, animations, mobjects, *, backend, encoder_fingerprint, renderer_state):
+    """Drop-in for manim's function of the same name, built from per-mobject digests."""
+    start = perf_counter()
+    hasher = _Hasher()
+    digest = hashlib.blake2b(f"v{HASH_VERSION}:{backend}:{encoder_fingerprint}".encode(), digest_size=32)
+    digest.update(_get_json(camera, _Memoizer()).encode())
+    for animation in sorted(animations, key=str):
+        digest.update(type(animation).__qualname__.encode())
+        hasher.attributes(animation, digest)
+    digest.update(f"mobjects{len(mobjects)}".encode())
+    for mob in mobjects:
+        digest.update(hasher.family(mob))
+    hasher.value(renderer_state, digest)
+    stats.plays += 1
+    stats.seconds += perf_counter() - start
+    logger.debug("Play hashed in %(ms).2f ms", {"ms": (perf_counter() - start) * 1000})
+    return digest.hexdigest()
+
+
+def log_stats():
+    """Log the play hashing stats of this process, if anything was hashed."""
+    if stats.plays:
+        logger.info("Play hashing: %(s)s", {"s": str(stats)})
+
+
+def install(report=True):
+    """Use the incremental hash for every play rendered by the Cairo renderer in this process."""
+    global _installed
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+    if report and not _installed:
+        atexit.register(log_stats)
+    _installed = True
@@ -0,0 +1,142 @@
+"""Cheaper encoding of frames that are held on screen, such as ``self.wait()``.
+
+Usage (from the repository root)::
+
+    python -m toolkit.holds media/videos/pythagorean/480p15/righttriangle.mp4 -o righttriangle_cfr.mp4
+
+A ``wait`` without updaters hands manim's encoder one frame with a repeat
+count, and the encoder converts and encodes that same frame once per repeat.
+`install` replaces the partial-movie encoder with one that does less for those
+holds, in one of two modes (``HOLD_FRAMES`` in the environment, default
+``vfr``):
+
+- ``vfr``: the held frame is encoded once at the start of the hold and once
+  at its last frame, with nothing in between. The MP4 has a variable frame
+  rate, plays back the same, and is much smaller.
+- ``cfr``: every frame is still written, for players and editors that need a
+  constant frame rate, but the frame is converted to the output pixel format
+  only once and the encoder gets the same picture each time.
+- ``off``: manim's own encoder.
+
+GIF output (``--format gif``) numbers the decoded frames one after another,
+which would shrink every ``vfr`` hold to two frames, so it always uses
+``cfr``.
+
+Running this module converts a finished VFR video to constant frame rate.
+"""
+
+import argparse
+from fractions import Fraction
+import os
+import sys
+
+import av
+from manim import config
+from manim.renderer import cairo_renderer
+from manim.scene import scene_file_writer
+from manim.scene.video_segment_encoder import VideoSegmentEncoder
+
+from toolkit.video import retime
+
+MODES = ("vfr", "cfr", "off")
+# Holds shorter than this are written frame by frame
+MIN_HOLD = 3
+_fingerprint = cairo_renderer.video_encoder_fingerprint
+
+
+class HoldFrameEncoder(VideoSegmentEncoder):
+    """`VideoSegmentEncoder` that writes repeated frames in `mode` ("vfr" or "cfr")."""
+
+    mode = "vfr"
+
+    def write_frame(self, pixels, *, repeat=1):
+        self._validate_frame(pixels, repeat)
+        time_base = Fraction(self.spec.frame_rate.denominator, self.spec.frame_rate.numerator)
+        # The held frame is converted once; the encoder takes its own reference
+        # to the picture, so the same frame can be sent again with a new pts
+        frame = av.VideoFrame.from_ndarray(pixels, format="rgba").reformat(format=self.spec.pixel_format)
+        frame.time_base = time_base
+        if effective_mode(self.mode) == "vfr" and repeat >= MIN_HOLD:
+            offsets = (0, repeat - 1)
+        else:
+            offsets = range(repeat)
+        try:
+            for offset in offsets:
+                frame.pts = self._next_pts + offset
+                for packet in self._stream.encode(frame):
+                    self._mux(packet)
+        except BaseException as error:
+            raise self._operation_error("encode", error) from error
+        self._next_pts += repeat
+
+    def _mux(self, packet):
+        # Without a duration the muxer stretches the last frame of a segment
+        # to the gap before it, which would lengthen a segment ending in a hold
+        if not packet.duration:
+            packet.duration = 1
+        self._container.mux(packet)
+
+    def finish(self):
+        # As VideoSegmentEncoder.finish, with the flushed packets going through `_mux`
+        if self._closed:
+            return
+        self._closed = True
+        first_error = None
+        try:
+            try:
+                for packet in self._stream.encode():
+                    self._mux(packet)
+            except Exception as error:
+                first_error = error
+        finally:
+            try:
+                self._container.close()
+            except Exception as error:
+                first_error = first_error or error
+        if first_error is not None:
+            raise self._operation_error("finish", first_error) from first_error
+
+
+def hold_mode():
+    """The mode requested through ``HOLD_FRAMES``, defaulting to ``vfr``."""
+    mode = os.environ.get("HOLD_FRAMES", "vfr").lower()
+    if mode not in MODES:
+        raise ValueError(f"HOLD_FRAMES must be one of {', '.join(MODES)}, not {mode!r}")
+    return mode
+
+
+def effective_mode(mode):
+    """`mode` for the current output format: GIFs need every frame, so ``vfr`` becomes ``cfr``."""
+    return "cfr" if mode == "vfr" and config.format == "gif" else mode
+
+
+def install(mode=None):
+    """Write held frames in `mode` (default: `hold_mode`) for every scene rendered in this process."""
+    mode = mode or hold_mode()
+    if mode == "off":
+        scene_file_writer.VideoSegmentEncoder = VideoSegmentEncoder
+        cairo_renderer.video_encoder_fingerprint = _fingerprint
+        return
+    HoldFrameEncoder.mode = mode
+    scene_file_writer.VideoSegmentEncoder = HoldFrameEncoder
+    # Partial movies written in one mode must not be reused by the other
+    # The format is read at render time, so a later --format gif still applies
+    cairo_renderer.video_encoder_fingerprint = lambda spec: f"{_fingerprint(spec)}:holds-{effective_mode(mode)}"
+
+
+def to_constant_rate(source, target):
+    """Re-encode the video `source` into `target`, repeating held frames at a constant rate."""
+    return retime(source, target)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m toolkit.holds", description="Convert a held-frame (VFR) video to constant frame rate")
+    parser.add_argument("video", help="video rendered with HOLD_FRAMES=vfr")
+    parser.add_argument("-o", "--output", required=True, help="constant frame rate copy")
+    args = parser.parse_args(argv)
+    print(f"written {to_constant_rate(args.video, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
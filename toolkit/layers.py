@@ -0,0 +1,165 @@
+"""A Scene that keeps everything that doesn't move in a cached background layer.
+
+Manim already draws the still mobjects of a ``play`` once and reuses that
+image for every frame, but it only counts as still what is drawn *before* the
+first animated mobject: anything added later stays on top in draw order, so it
+is redrawn every frame. In a construction that keeps growing, that is nearly
+everything. `LayeredScene` also moves those later mobjects into the background
+when they can't overlap anything that moves (automatic mode), or when they have
+been frozen explicitly with `LayeredScene.freeze`. The background image is kept
+across plays and only rasterized again when its content changes.
+"""
+
+import numpy as np
+from manim import AnimationGroup, Homotopy, Rotating, Scene
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_difference_update, list_update
+
+from toolkit.hashing import mobject_digests
+
+# Room around bounding boxes for stroke width and anti-aliasing, in scene units
+OVERLAP_MARGIN = 0.1
+
+
+def _animation_mobjects(animations):
+    """Every mobject an animation may draw: its own and any it moves towards or along."""
+    for animation in animations:
+        yield animation.mobject
+        for value in animation.__dict__.values():
+            if hasattr(value, "get_family") and value is not animation.mobject:
+                yield value
+        if isinstance(animation, AnimationGroup):
+            yield from _animation_mobjects(animation.animations)
+
+
+def _has_unbounded_path(animations):
+    """Whether an animation may leave the boxes of its start and end states."""
+    for animation in animations:
+        if isinstance(animation, (Homotopy, Rotating)) or getattr(animation, "path_arc", 0):
+            return True
+        if isinstance(animation, AnimationGroup) and _has_unbounded_path(animation.animations):
+            return True
+    return False
+
+
+def _boxes(mobjects):
+    """``(min, max)`` corners of every family member of `mobjects` with points."""
+    boxes = []
+    for mob in mobjects:
+        for member in mob.get_family():
+            if member.has_points():
+                boxes.append((member.points[:, :2].min(axis=0) - OVERLAP_MARGIN, member.points[:, :2].max(axis=0) + OVERLAP_MARGIN))
+    return boxes
+
+
+def _overlaps(mob, boxes):
+    low, high = mob.points[:, :2].min(axis=0), mob.points[:, :2].max(axis=0)
+    return any(np.all(low <= box_high) and np.all(box_low <= high) for box_low, box_high in boxes)
+
+
+def _release(moving, still):
+    """Split the flat family list `moving` into what keeps moving and what goes to the background.
+
+    The camera draws every mobject with its whole family, so a released
+    mobject needs all its members with points released too, and a moving
+    mobject with points can't have any released. Parents without points are
+    left out of the moving list once any of their family is released; their
+    moving members are in it on their own.
+    """
+    released = {mob for mob in moving if still(mob)}
+    changed = True
+    while changed:
+        changed = False
+        for mob in moving:
+            family = mob.family_members_with_points()
+            if mob in released and not all(member in released for member in family):
+                released.discard(mob)
+                changed = True
+            elif mob not in released and mob.has_points() and any(member in released for member in family):
+                released.difference_update(family)
+                changed = True
+    kept = [mob for mob in moving if not any(member in released for member in mob.get_family())]
+    return kept, released
+
+
+class LayeredScene(Scene):
+    """Scene whose still mobjects are rasterized once into a shared background.
+
+    Set ``auto_freeze = False`` on a subclass to only use explicit `freeze` calls.
+    """
+
+    auto_freeze = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frozen = set()
+        self.background_key = None
+        self.background = None
+        renderer = self.renderer
+        renderer_save = renderer.save_static_frame_data
+
+        def save_static_frame_data(scene, static_mobjects):
+            if not static_mobjects:
+                return renderer_save(scene, static_mobjects)
+            camera = renderer.camera
+            key = (
+                tuple(camera.frame_center),
+                camera.frame_width,
+                camera.frame_height,
+                str(camera.background_color),
+                camera.background_opacity,
+                tuple(mobject_digests(static_mobjects)),
+            )
+            if key == self.background_key:
+                renderer.static_image = self.background
+                return self.background
+            self.background = renderer_save(scene, static_mobjects)
+            self.background_key = key
+            return self.background
+
+        renderer.save_static_frame_data = save_static_frame_data
+
+    def freeze(self, *mobjects):
+        """Keep `mobjects` in the background layer while they aren't animated.
+
+        Frozen mobjects are drawn below everything that moves, whatever their
+        place in the draw order.
+        """
+        for mob in mobjects:
+            self.frozen.update(mob.get_family())
+
+    def unfreeze(self, *mobjects):
+        """Undo `freeze` for `mobjects`, or for everything if none are given."""
+        if not mobjects:
+            self.frozen.clear()
+        for mob in mobjects:
+            self.frozen.difference_update(mob.get_family())
+
+    def get_moving_and_static_mobjects(self, animations):
+        moving, static = super().get_moving_and_static_mobjects(animations)
+        animations = list(animations)
+        animated = set()
+        for mob in _animation_mobjects(animations):
+            animated.update(mob.get_family())
+        always_moving = animated | set(self.foreground_mobjects)
+        for mob in moving:
+            if mob.updaters:
+                always_moving.update(mob.get_family())
+
+        auto = self.auto_freeze and not _has_unbounded_path(animations) and not any(m.updaters for m in moving)
+        boxes = _boxes(always_moving) if auto else []
+
+        def still(mob):
+            if mob in always_moving or not mob.has_points():
+                return False
+            return mob in self.frozen or (auto and not _overlaps(mob, boxes))
+
+        moving, released = _release(moving, still)
+        if not released:
+            return moving, static
+        all_mobjects = extract_mobject_family_members(
+            list_update(self.mobjects, self.foreground_mobjects),
+            use_z_index=self.renderer.camera.use_z_index,
+            only_those_with_points=True,
+        )
+        return moving, list_difference_update(all_mobjects, moving)
@@ -0,0 +1,46 @@
+"""Screen-space level of detail for long polylines."""
+
+from manim import config
+import numpy as np
+
+
+def screen_columns(width, oversample=2):
+    """Number of pixel columns that `width` scene units cover at the current quality."""
+    return max(1, int(np.ceil(width * config.pixel_width / config.frame_width * oversample)))
+
+
+def decimate_polyline(points, columns):
+    """Reduce an x-monotone polyline to its per-column min/max envelope.
+
+    For every one of `columns` equal slices of the x extent only the first, last,
+    lowest and highest corner are kept, in their original order. Rasterized at
+    that column width the result is indistinguishable from the full polyline.
+    Polylines that are already small enough, or whose x is not monotone, are
+    returned unchanged.
+    """
+    points = np.asarray(points)
+    if len(points) <= 4 * columns:
+        return points
+    xs, ys = points[:, 0], points[:, 1]
+    if np.any(np.diff(xs) < 0):
+        return points
+
+    span = xs[-1] - xs[0]
+    if span <= 0:
+        return points
+    column = np.minimum(((xs - xs[0]) / span * columns).astype(np.int64), columns - 1)
+    starts = np.flatnonzero(np.diff(column, prepend=-1))
+    ends = np.append(starts[1:], len(points)) - 1
+
+    # Sorting by (column, y) puts each column's lowest corner at its start
+    # and its highest corner at its end
+    by_height = np.lexsort((ys, column))
+    keep = np.concatenate([starts, ends, by_height[starts], by_height[ends]])
+    return points[np.unique(keep)]
+
+
+def decimate_for_screen(points, oversample=2):
+    """Decimate `points` to the pixel columns their x extent covers on screen."""
+    points = np.asarray(points)
+    width = points[:, 0].max() - points[:, 0].min() if len(points) else 0
+    return decimate_polyline(points, screen_columns(width, oversample))
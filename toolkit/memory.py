@@ -0,0 +1,154 @@
+"""Mobject census and memory use after every play of a render.
+
+Usage (from the repository root)::
+
+    python -m toolkit.memory randomwalk.py RandomWalk -o memory.json
+    RANDOMWALK_ADDITIONAL_STEPS=10000000 python -m toolkit.memory randomwalk.py RandomWalk --budget-mb 4000
+
+After each ``play``/``wait`` the report records how many mobjects are in the
+scene, their total point count, the bytes held in point arrays, and the change
+in traced Python allocations and RSS. It also lists mobjects that are still
+attached to the scene but fully transparent, such as something faded out but
+never removed: they still cost memory and time every frame.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import resource
+import sys
+import tracemalloc
+
+import numpy as np
+
+from toolkit.render import configure, create_scene
+
+
+def current_rss_mb():
+    """Resident set size of this process, from /proc where available."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Peak rather than current, but better than nothing
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def is_invisible(mob):
+    """Whether nothing in the family of `mob` would show up in a frame."""
+    from manim import VMobject
+
+    for member in mob.get_family():
+        if not isinstance(member, VMobject):
+            if member.has_points() or not member.submobjects:
+                # Images and other non-vector mobjects: assume they are visible
+                return False
+            continue
+        if not member.has_points():
+            continue
+        width = member.get_stroke_width()
+        if np.any(member.get_fill_opacities() > 0) or (width > 0 and np.any(member.get_stroke_opacities() > 0)):
+            return False
+    return True
+
+
+def census(scene):
+    """Counts and sizes for everything currently in `scene`."""
+    family = scene.get_mobject_family_members()
+    points = [m.points for m in family if len(m.points)]
+    hidden = [m for m in scene.mobjects if is_invisible(m)]
+    return {
+        "top_level": len(scene.mobjects),
+        "mobjects": len(family),
+        "points": int(sum(len(p) for p in points)),
+        "point_bytes": int(sum(p.nbytes for p in points)),
+        "invisible": [
+            {"type": type(m).__name__, "mobjects": len(m.get_family()), "points": int(sum(len(s.points) for s in m.get_family()))}
+            for m in hidden
+        ],
+    }
+
+
+class MemoryReport:
+    """Takes a `census` after every play; `attach` it before ``scene.render()``."""
+
+    def __init__(self, trace_allocations=True):
+        self.rows = []
+        self.trace_allocations = trace_allocations
+
+    def attach(self, scene):
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        renderer = scene.renderer
+        renderer_play = renderer.play
+        last = {"traced": self._traced(), "rss": current_rss_mb()}
+
+        def play(played, *args, **kwargs):
+            renderer_play(played, *args, **kwargs)
+            traced, rss = self._traced(), current_rss_mb()
+            row = census(played)
+            row.update(
+                play=len(self.rows),
+                animations=[type(a).__name__ for a in played.animations or []],
+                traced_mb=traced,
+                traced_delta_mb=traced - last["traced"],
+                rss_mb=rss,
+                rss_delta_mb=rss - last["rss"],
+            )
+            last.update(traced=traced, rss=rss)
+            self.rows.append(row)
+
+        renderer.play = play
+        return self
+
+    def _traced(self):
+        return tracemalloc.get_traced_memory()[0] / 2**20 if tracemalloc.is_tracing() else 0.0
+
+    def peak_rss_mb(self):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    def format(self):
+        lines = [f"{'play':>4}  {'mobjects':>8}  {'points':>10}  {'point MB':>8}  {'traced MB':>9}  {'RSS MB':>7}  {'dRSS':>6}  animations"]
+        for r in self.rows:
+            lines.append(
+                f"{r['play']:>4}  {r['mobjects']:>8}  {r['points']:>10}  {r['point_bytes'] / 2**20:>8.1f}  "
+                f"{r['traced_mb']:>9.1f}  {r['rss_mb']:>7.0f}  {r['rss_delta_mb']:>+6.0f}  {' + '.join(r['animations'])}"
+            )
+        if self.rows and self.rows[-1]["invisible"]:
+            lines.append("invisible but still in the scene at the end:")
+            for hidden in self.rows[-1]["invisible"]:
+                lines.append(f"  {hidden['type']} ({hidden['mobjects']} mobjects, {hidden['points']} points)")
+        lines.append(f"peak RSS {self.peak_rss_mb():.0f} MB")
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m toolkit.memory", description="Memory report for one scene render")
+    parser.add_argument("file", help="scene file")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk", help="manim quality flag (default: l)")
+    parser.add_argument("-o", "--output", help="also write the per-play rows as JSON")
+    parser.add_argument("--budget-mb", type=float, help="exit with status 1 if peak RSS goes over this")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="skip allocation tracing, which slows the render")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    configure(args.file, args.quality, disable_caching=True)
+    report = MemoryReport(trace_allocations=not args.no_tracemalloc)
+    scene = create_scene(args.file, args.scene, args.seed)
+    report.attach(scene)
+    scene.render()
+    print(report.format())
+    if args.output:
+        Path(args.output).write_text(json.dumps({"peak_rss_mb": report.peak_rss_mb(), "plays": report.rows}, indent=2))
+    if args.budget_mb is not None and report.peak_rss_mb() > args.budget_mb:
+        print(f"over budget: peak RSS {report.peak_rss_mb():.0f} MB > {args.budget_mb:.0f} MB")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Custom mobjects used by the scenes."""
+
+from manim import WHITE, ImageMobject, ManimColor, VMobject
+import numpy as np
+
+
+def segment_points(starts, ends):
+    """Bezier points for straight segments from `starts` to `ends`, one cubic curve each."""
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    t = np.linspace(0, 1, 4)
+    points = starts[:, None, :] + t[None, :, None] * (ends - starts)[:, None, :]
+    return points.reshape(-1, 3)
+
+
+class SegmentBatch(VMobject):
+    """Many disjoint straight segments held in one point array with one shared stroke.
+
+    The whole batch is styled, hashed and rasterized as a single mobject, and
+    ``Create`` grows every segment at the same time, the way
+    ``Create(VGroup(*lines), lag_ratio=0)`` does for separate lines.
+    """
+
+    def __init__(self, starts, ends, **kwargs):
+        super().__init__(**kwargs)
+        self.set_points(segment_points(starts, ends))
+
+    def get_segment_count(self):
+        return len(self.points) // self.n_points_per_cubic_curve
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        nppcc = self.n_points_per_cubic_curve
+        points = vmobject.points
+        if (a <= 0 and b >= 1) or len(points) % nppcc:
+            return super().pointwise_become_partial(vmobject, a, b)
+        # Cut every segment down to [a, b] of its own length instead of
+        # revealing the segments one after the other
+        starts = points[0::nppcc]
+        ends = points[nppcc - 1 :: nppcc]
+        t = np.linspace(a, b, nppcc)
+        partial = starts[:, None, :] + t[None, :, None] * (ends - starts)[:, None, :]
+        self.points = partial.reshape(-1, self.dim)
+        return self
+
+
+class DensityImage(ImageMobject):
+    """Heatmap of an ``(x_bins, y_bins)`` count array laid over a region of `axes`.
+
+    Each column is normalized to its own peak so the spread of the distribution
+    stays visible as it widens.
+    """
+
+    def __init__(self, counts, axes, x_range, y_range, color=WHITE, **kwargs):
+        counts = np.asarray(counts, dtype=float)
+        peak = counts.max(axis=1, keepdims=True)
+        density = np.divide(counts, peak, out=np.zeros_like(counts), where=peak > 0)
+
+        # Image rows run top to bottom, histogram rows bottom to top
+        pixels = np.zeros((counts.shape[1], counts.shape[0], 4), dtype=np.uint8)
+        pixels[..., :3] = ManimColor(color).to_int_rgb()
+        pixels[..., 3] = np.round(255 * density.T[::-1]).astype(np.uint8)
+        super().__init__(pixels, **kwargs)
+
+        lower_left = axes.c2p(x_range[0], y_range[0])
+        upper_right = axes.c2p(x_range[1], y_range[1])
+        self.stretch_to_fit_width(upper_right[0] - lower_left[0])
+        self.stretch_to_fit_height(upper_right[1] - lower_left[1])
+        self.move_to((lower_left + upper_right) / 2)
@@ -0,0 +1,44 @@
+"""On-disk storage of vector outlines, shared by the TeX and Text caches.
+
+A list of ``VMobject`` s is stored as one ``.npz`` file holding their points,
+fill and stroke colours (concatenated, with offsets) and stroke widths. Only
+geometry and colours are kept.
+"""
+
+import os
+
+import numpy as np
+from manim import VMobject
+
+
+def save_outlines(path, mobjects):
+    """Write the outlines of `mobjects` to `path`, replacing it atomically."""
+    points = [mob.points for mob in mobjects]
+    fills = [mob.fill_rgbas for mob in mobjects]
+    strokes = [mob.stroke_rgbas for mob in mobjects]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez(
+        partial,
+        points=np.concatenate(points) if points else np.zeros((0, 3)),
+        point_offsets=np.cumsum([0] + [len(p) for p in points]),
+        fill_rgbas=np.concatenate(fills) if fills else np.zeros((0, 4)),
+        fill_offsets=np.cumsum([0] + [len(f) for f in fills]),
+        stroke_rgbas=np.concatenate(strokes) if strokes else np.zeros((0, 4)),
+        stroke_offsets=np.cumsum([0] + [len(s) for s in strokes]),
+        stroke_widths=np.array([mob.stroke_width for mob in mobjects], dtype=float),
+    )
+    os.replace(partial, path)
+
+
+def load_outlines(path):
+    """The ``VMobject`` s written to `path` by `save_outlines`."""
+    with np.load(path, allow_pickle=False) as data:
+        mobjects = []
+        for i, width in enumerate(data["stroke_widths"]):
+            mob = VMobject(stroke_width=width)
+            mob.set_points(data["points"][data["point_offsets"][i] : data["point_offsets"][i + 1]])
+            mob.fill_rgbas = data["fill_rgbas"][data["fill_offsets"][i] : data["fill_offsets"][i + 1]]
+            mob.stroke_rgbas = data["stroke_rgbas"][data["stroke_offsets"][i] : data["stroke_offsets"][i + 1]]
+            mobjects.append(mob)
+    return mobjects
@@ -0,0 +1,140 @@
+"""Moving along and drawing long paths.
+
+``VMobject.point_from_proportion`` measures every curve of the path (ten
+samples each, in Python) on every call, so ``MoveAlongPath`` along a walk of
+``n`` steps costs ``O(n)`` per frame. `ArcLengthTable` measures all curves at
+once with numpy, with the same sampling, and answers lookups with a binary
+search. `arc_length_table` keeps one table per path and rebuilds it only when
+the path's points change, checked in constant time.
+
+``Create`` rebuilds the whole partial path on every frame. `CreatePath` keeps
+the full points in a buffer and shows a growing prefix of it, so a frame only
+rewrites the curve at the tip. It reveals the path by arc length, as
+`FollowPath` moves along it, so a mobject following the path with the same
+rate function stays on the tip of the line being drawn.
+"""
+
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from manim import Animation, Create
+from manim.utils.bezier import partial_bezier_points
+
+# Samples per curve, as in VMobject.get_nth_curve_length_pieces
+SAMPLES = 10
+_ts = np.linspace(0, 1, SAMPLES)[:, None]
+# Cubic Bernstein basis at the sample parameters, shape (SAMPLES, 4)
+_BASIS = np.hstack([(1 - _ts) ** 3, 3 * (1 - _ts) ** 2 * _ts, 3 * (1 - _ts) * _ts**2, _ts**3])
+# path -> (its points array, probe of a few points, table)
+_tables = WeakKeyDictionary()
+
+
+class ArcLengthTable:
+    """Cumulative curve lengths of a path, for proportion-to-point lookups."""
+
+    def __init__(self, points):
+        if not len(points):
+            raise ValueError("Cannot measure a path without points")
+        self.curves = np.array(points[: len(points) // 4 * 4]).reshape(-1, 4, 3)
+        samples = np.einsum("sk,nkd->nsd", _BASIS, self.curves)
+        self.lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+        self.cumulative = np.concatenate([[0.0], np.cumsum(self.lengths)])
+        self.end = np.array(points[-1])
+
+    @property
+    def total(self):
+        return self.cumulative[-1]
+
+    def curve_from_proportion(self, alpha):
+        """``(n, t)``: the point `alpha` of the way along the path is at parameter `t` of curve `n`."""
+        if alpha < 0 or alpha > 1:
+            raise ValueError(f"Alpha {alpha} not between 0 and 1.")
+        target = alpha * self.total
+        # First curve whose end reaches the target length
+        n = min(int(np.searchsorted(self.cumulative[1:], target)), len(self.lengths) - 1)
+        length = self.lengths[n]
+        t = min((target - self.cumulative[n]) / length, 1.0) if length else 0.0
+        return n, t
+
+    def point_from_proportion(self, alpha):
+        """Same result as ``VMobject.point_from_proportion(alpha)`` on the measured path."""
+        if alpha == 1:
+            return self.end.copy()
+        n, t = self.curve_from_proportion(alpha)
+        return np.array([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t**2, t**3]) @ self.curves[n]
+
+
+def _probe(points):
+    # Transforms in place (shift, scale, rotate ...) move the ends or the middle
+    return points[[0, len(points) // 2, -1]].tobytes() if len(points) else b""
+
+
+def arc_length_table(path):
+    """The `ArcLengthTable` of `path`, measured again only if its points changed.
+
+    The check is O(1): the same array (kept alive, so its id can't be reused)
+    with the same first, middle and last points. An edit in place that leaves
+    those three points where they were isn't noticed.
+    """
+    points = path.points
+    cached = _tables.get(path)
+    if cached is None or cached[0] is not points or cached[1] != _probe(points):
+        cached = _tables[path] = (points, _probe(points), ArcLengthTable(points))
+    return cached[2]
+
+
+class FollowPath(Animation):
+    """``MoveAlongPath`` with arc-length lookups in ``O(log n)`` per frame.
+
+    By default the path is measured once, when the animation is made, so it can
+    be drawn in the same ``play``: the mobject then moves along the finished
+    path rather than the partly drawn one, and with `CreatePath` it stays on
+    the tip. Pass ``snapshot=False`` to follow the path as it is on every frame.
+    """
+
+    def __init__(self, mobject, path, snapshot=True, suspend_mobject_updating=False, **kwargs):
+        self.path = path
+        # Before any animation of the play has started changing the path
+        self.table = ArcLengthTable(path.points) if snapshot else None
+        super().__init__(mobject, suspend_mobject_updating=suspend_mobject_updating, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        table = self.table if self.table is not None else arc_length_table(self.path)
+        self.mobject.move_to(table.point_from_proportion(self.rate_func(alpha)))
+
+
+class CreatePath(Create):
+    """``Create`` for a single long path (no submobjects), such as a polyline.
+
+    The path's points become a growing view of a buffer holding all of them;
+    each frame only rewrites the curve being drawn, instead of copying every
+    point, so the cost of a frame doesn't grow with the length of the path.
+
+    Unlike ``Create``, which reveals the same number of curves per frame
+    whatever their length, the path is drawn at constant speed along its arc
+    length, so the tip is where `FollowPath` puts a mobject.
+    """
+
+    def begin(self):
+        if self.mobject.submobjects:
+            raise ValueError("CreatePath only draws paths without submobjects; use Create")
+        self.full = self.mobject.points.copy()
+        self.buffer = self.full.copy()
+        self.table = ArcLengthTable(self.full)
+        # Curve whose points in `buffer` are cut short
+        self.cursor = 0
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        index, residue = self.table.curve_from_proportion(self.rate_func(alpha))
+        start = 4 * index
+        if index != self.cursor:
+            self.buffer[4 * self.cursor : 4 * self.cursor + 4] = self.full[4 * self.cursor : 4 * self.cursor + 4]
+            self.cursor = index
+        self.buffer[start : start + 4] = partial_bezier_points(self.full[start : start + 4], 0, residue)
+        self.mobject.points = self.buffer[: start + 4]
+
+    def finish(self):
+        super().finish()
+        # Leave the path with its own points rather than a view of the buffer
+        self.mobject.points = self.full.copy()
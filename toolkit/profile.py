@@ -0,0 +1,143 @@
+"""Per-play profiling of a render, exported as a Chrome trace.
+
+Usage (from the repository root)::
+
+    python -m toolkit.profile pythagorean.py righttriangle -o trace.json
+
+Open the trace in ``chrome://tracing`` or https://ui.perfetto.dev. There is
+one track per stage:
+
+- construct: scene code between animations (building mobjects, ``copy`` ...)
+- play: each ``play``/``wait`` call, named by its animations and the line of
+  the scene file it was called from
+- interpolate: ``interpolate`` and updaters, per frame
+- rasterize: Cairo drawing of the frame, per frame
+- encode: handing frames to the video encoder and finishing each partial movie
+
+The slowest calls are also printed when the render ends.
+"""
+
+import argparse
+from collections import defaultdict
+import inspect
+import json
+from pathlib import Path
+import sys
+import time
+
+from toolkit.render import configure, create_scene
+
+TRACKS = ["construct", "play", "interpolate", "rasterize", "encode"]
+
+
+class Profiler:
+    """Collects trace events for one scene; `attach` it before ``scene.render()``."""
+
+    def __init__(self):
+        self.events = []
+        self.play_totals = []
+        self.origin = time.perf_counter()
+        self.current_play = None
+        self.stage_seconds = defaultdict(float)
+
+    def now(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def record(self, track, name, start, end, **args):
+        self.events.append({"name": name, "cat": track, "ph": "X", "ts": start, "dur": end - start, "pid": 1, "tid": TRACKS.index(track), "args": args})
+        self.stage_seconds[track] += (end - start) / 1e6
+
+    def timed(self, track, func, name=None):
+        """Wrap `func` so every call is recorded on `track`."""
+
+        def wrapper(*args, **kwargs):
+            start = self.now()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(track, name or self.current_play or func.__name__, start, self.now())
+
+        return wrapper
+
+    def attach(self, scene):
+        scene_file = inspect.getsourcefile(type(scene))
+        renderer = scene.renderer
+        renderer_play = renderer.play
+        last_end = [self.now()]
+
+        def play(played, *args, **kwargs):
+            start = self.now()
+            self.record("construct", "construct", last_end[0], start)
+            line = _caller_line(scene_file)
+            self.current_play = None
+            try:
+                renderer_play(played, *args, **kwargs)
+            finally:
+                end = self.now()
+                label = f"{_animation_names(played.animations)} ({Path(scene_file).name}:{line})"
+                self.record("play", label, start, end, play_index=len(self.play_totals), line=line)
+                self.play_totals.append(((end - start) / 1e6, label))
+                last_end[0] = end
+
+        def begin_animations():
+            # The label is known once the animations are compiled
+            self.current_play = _animation_names(scene.animations)
+            scene_begin_animations()
+
+        scene_begin_animations = scene.begin_animations
+        scene.begin_animations = begin_animations
+        renderer.play = play
+        scene.update_to_time = self.timed("interpolate", scene.update_to_time)
+        renderer.update_frame = self.timed("rasterize", renderer.update_frame)
+        renderer.add_frame = self.timed("encode", renderer.add_frame)
+        renderer.file_writer.end_animation = self.timed("encode", renderer.file_writer.end_animation, "finish partial movie")
+        return self
+
+    def trace(self):
+        names = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": i, "args": {"name": track}} for i, track in enumerate(TRACKS)]
+        return {"traceEvents": names + self.events, "displayTimeUnit": "ms"}
+
+    def summary(self, top=10):
+        lines = ["time per stage: " + ", ".join(f"{t} {self.stage_seconds[t]:.2f}s" for t in TRACKS)]
+        lines.append(f"slowest of {len(self.play_totals)} calls:")
+        for seconds, label in sorted(self.play_totals, reverse=True)[:top]:
+            lines.append(f"  {seconds:8.3f}s  {label}")
+        return "\n".join(lines)
+
+
+def _animation_names(animations):
+    return " + ".join(type(a).__name__ for a in animations or []) or "play"
+
+
+def _caller_line(scene_file):
+    """Line of the scene file that is currently calling into manim."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename == scene_file:
+            return frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m toolkit.profile", description="Profile one scene render")
+    parser.add_argument("file", help="scene file")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk", help="manim quality flag (default: l)")
+    parser.add_argument("-o", "--output", default="trace.json", help="Chrome trace file (default: trace.json)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    # Cached partial movies would hide the work being measured
+    configure(args.file, args.quality, disable_caching=True)
+    scene = create_scene(args.file, args.scene, args.seed)
+    profiler = Profiler().attach(scene)
+    scene.render()
+    Path(args.output).write_text(json.dumps(profiler.trace()))
+    print(profiler.summary())
+    print(f"trace written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""Render every scene in the repository in parallel.
+
+Usage (from the repository root)::
+
+    python -m toolkit.render                      # every scene, low quality
+    python -m toolkit.render pythagorean.py -q h  # one file, high quality
+    python -m toolkit.render --scene RandomWalk --workers 2
+
+Each scene renders in its own ``manim`` process; the runner keeps up to
+``--workers`` of them going at once and prints a summary of timings and exit
+codes when they are all done.
+"""
+
+import argparse
+import ast
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Directories that never hold scenes
+SKIP_DIRS = {"toolkit", "media", "__pycache__"}
+SCENE_BASES = {"Scene", "MovingCameraScene", "ThreeDScene", "ZoomedScene", "VectorScene", "LinearTransformationScene", "LayeredScene"}
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass
+class SceneJob:
+    path: Path
+    name: str
+
+    @property
+    def label(self):
+        return f"{self.path.stem}.{self.name}"
+
+
+@dataclass
+class RenderResult:
+    job: SceneJob
+    returncode: int
+    seconds: float
+    log_file: Path
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+
+def scene_classes(path):
+    """Names of the ``Scene`` subclasses defined in the source file `path`, in order.
+
+    The file is parsed rather than imported, so finding scenes never imports
+    manim or runs scene code.
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    bases = set(SCENE_BASES)
+    names = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        base_names = {b.id if isinstance(b, ast.Name) else getattr(b, "attr", None) for b in node.bases}
+        if base_names & bases:
+            # Subclasses of scenes defined earlier in the file count too
+            bases.add(node.name)
+            names.append(node.name)
+    return names
+
+
+def scene_files(root=REPO_ROOT):
+    """Every ``.py`` file under `root` that may define scenes."""
+    for path in sorted(Path(root).rglob("*.py")):
+        parts = path.relative_to(root).parts
+        if any(part in SKIP_DIRS or part.startswith(".") or part.endswith("-env") for part in parts[:-1]):
+            continue
+        yield path
+
+
+def find_scenes(paths=(), names=()):
+    """`SceneJob`s for the scenes in `paths` (files or directories; default the whole repo)."""
+    files = []
+    for path in paths or [REPO_ROOT]:
+        path = Path(path).resolve()
+        files.extend(scene_files(path) if path.is_dir() else [path])
+    jobs = [SceneJob(path, name) for path in files for name in scene_classes(path)]
+    if names:
+        jobs = [job for job in jobs if job.name in names]
+    return jobs
+
+
+def load_scene_class(path, name):
+    """Import the scene file `path` the way ``manim`` does and return its class `name`."""
+    from manim.utils.module_ops import get_module
+
+    return getattr(get_module(Path(path).resolve()), name)
+
+
+def create_scene(path, name, seed=None):
+    """An instance of the scene `name` from `path`, seeded with `seed` if given.
+
+    The seed goes to the scene rather than to manim's global config, so it
+    doesn't outlive the task in a reused worker process.
+    """
+    return load_scene_class(path, name)(random_seed=seed)
+
+
+# Config keys the tools override per render; `configure` puts them back first
+RESET_KEYS = (
+    "dry_run",
+    "from_animation_number",
+    "upto_animation_number",
+    "disable_caching",
+    "partial_movie_dir",
+    "output_file",
+    "max_files_cached",
+)
+# Their values before the first `configure` in this process
+_config_defaults = None
+
+
+def configure(path, quality="l", **overrides):
+    """Set manim's global config for rendering a scene from `path` in this process.
+
+    Used by the tools that render inside their own worker processes instead of
+    going through the ``manim`` command line. Pool workers render several tasks
+    in turn, so the keys in `RESET_KEYS` go back to their defaults before the
+    `overrides` of this task are applied. Seeds are passed to `create_scene`
+    instead: manim's config can't be set back to "no seed".
+    """
+    global _config_defaults
+    from manim import config
+
+    if _config_defaults is None:
+        _config_defaults = {key: config[key] for key in RESET_KEYS}
+    for key, value in _config_defaults.items():
+        config[key] = value
+    config.input_file = str(Path(path).resolve())
+    config.quality = QUALITIES[quality]
+    for key, value in overrides.items():
+        config[key] = value
+    return config
+
+
+def render_job(job, quality="l", extra_args=(), log_dir=None):
+    """Render one scene in a ``manim`` subprocess and time it."""
+    log_dir = Path(log_dir or REPO_ROOT / "media" / "render_logs")
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / f"{job.label}.log"
+    command = [sys.executable, "-m", "manim", "render", f"-q{quality}", *extra_args, str(job.path), job.name]
+    start = time.perf_counter()
+    if set(extra_args) <= {"-p"}:
+        from toolkit import daemon
+
+        if daemon.available():
+            # A warm render server skips the interpreter and manim start-up
+            response = daemon.request_render(job.path, job.name, quality, preview="-p" in extra_args)
+            log_file.write_text(f"render server request\n\n{json.dumps(response, indent=2)}\n", encoding="utf-8")
+            return RenderResult(job, 0 if response["ok"] else 1, time.perf_counter() - start, log_file)
+    with open(log_file, "w", encoding="utf-8") as log:
+        log.write(" ".join(command) + "\n\n")
+        log.flush()
+        returncode = subprocess.run(command, cwd=REPO_ROOT, stdout=log, stderr=subprocess.STDOUT).returncode
+    return RenderResult(job, returncode, time.perf_counter() - start, log_file)
+
+
+def render_all(jobs, workers=None, quality="l", extra_args=(), on_result=None):
+    """Render `jobs` with up to `workers` scenes at a time; results keep the order of `jobs`.
+
+    `on_result` is called with each `RenderResult` as soon as it is reported.
+    """
+    workers = workers or min(len(jobs), os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [pool.submit(render_job, job, quality, extra_args) for job in jobs]
+        results = []
+        for future in futures:
+            result = future.result()
+            status = "ok" if result.ok else f"FAILED ({result.returncode})"
+            print(f"{result.job.label}: {status} in {result.seconds:.1f}s", flush=True)
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+    return results
+
+
+def format_summary(results, wall_seconds):
+    width = max([len(r.job.label) for r in results] + [5])
+    lines = [f"{'scene':<{width}}  {'exit':>4}  {'seconds':>8}"]
+    for r in results:
+        lines.append(f"{r.job.label:<{width}}  {r.returncode:>4}  {r.seconds:>8.1f}")
+    total = sum(r.seconds for r in results)
+    lines.append(f"{len(results)} scenes in {wall_seconds:.1f}s wall ({total:.1f}s of rendering)")
+    for r in results:
+        if not r.ok:
+            lines.append(f"{r.job.label} failed, see {r.log_file}")
+    return "\n".join(lines)
+
+
+def summary_dict(results, wall_seconds):
+    return {
+        "wall_seconds": wall_seconds,
+        "scenes": [
+            {
+                "file": str(r.job.path.relative_to(REPO_ROOT) if r.job.path.is_relative_to(REPO_ROOT) else r.job.path),
+                "scene": r.job.name,
+                "returncode": r.returncode,
+                "seconds": r.seconds,
+                "log": str(r.log_file),
+            }
+            for r in results
+        ],
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m toolkit.render", description="Render scenes in parallel")
+    parser.add_argument("paths", nargs="*", help="scene files or directories (default: the whole repository)")
+    parser.add_argument("-s", "--scene", action="append", default=[], help="only render scenes with this class name")
+    parser.add_argument("-w", "--workers", type=int, help="scenes to render at once (default: one per core)")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk", help="manim quality flag (default: l)")
+    parser.add_argument("-p", "--preview", action="store_true", help="open each video when it is done")
+    parser.add_argument("--summary", help="also write the summary as JSON to this file")
+    parser.add_argument("--list", action="store_true", help="only list the scenes that would be rendered")
+    parser.add_argument("--export", default="", help="also write these qualities (e.g. lm), resampled from one render at the highest")
+    parser.add_argument("--cfr", action="store_true", help="write every frame of waits, for a constant frame rate (see toolkit.holds)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, manim_args = parser.parse_known_args(argv)
+    jobs = find_scenes(args.paths, args.scene)
+    if not jobs:
+        parser.error("no scenes found")
+    if args.list:
+        for job in jobs:
+            print(job.label)
+        return 0
+
+    if args.preview:
+        manim_args = ["-p", *manim_args]
+    if args.cfr:
+        # Read by toolkit.holds in the scene processes
+        os.environ["HOLD_FRAMES"] = "cfr"
+    if set(args.export) - set(QUALITIES):
+        parser.error(f"--export takes quality flags from {''.join(QUALITIES)}")
+    start = time.perf_counter()
+    if args.export:
+        from toolkit.exports import LOSSLESS_ARGS, export_scene, highest
+
+        quality = highest(args.quality + args.export)
+        exports = []
+        with ProcessPoolExecutor(args.workers) as pool:
+
+            def on_result(result):
+                if result.ok:
+                    exports.extend(export_scene(pool, result.job.path, result.job.name, quality, set(args.export + args.quality)))
+
+            # A lossless master, from which every quality is encoded once
+            results = render_all(jobs, args.workers, quality, [*manim_args, *LOSSLESS_ARGS], on_result)
+            for future in exports:
+                print(f"exported {Path(future.result()).relative_to(REPO_ROOT)}", flush=True)
+    else:
+        results = render_all(jobs, args.workers, args.quality, manim_args)
+    wall = time.perf_counter() - start
+    print(format_summary(results, wall))
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(summary_dict(results, wall), indent=2), encoding="utf-8")
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Render one scene in parallel, a run of consecutive animations per worker.
+
+Usage (from the repository root)::
+
+    python -m toolkit.sections pythagorean.py righttriangle -q h -w 16
+
+A first pass replays ``construct`` with every animation skipped, which only
+jumps each animation to its end state, to learn how many ``play``/``wait``
+calls there are and how long each runs. The calls are then cut into
+contiguous runs of about equal length. Each worker process replays the scene
+the same cheap way up to the start of its run, renders its run for real, and
+the per-run movies are concatenated without re-encoding.
+
+Every worker uses the same seed, so scenes that draw random numbers render
+the same frames as a single-process render. Updaters that depend on ``dt``
+see one large step for a skipped animation, as they do with ``manim -n``.
+
+With ``--split-long``, an animation longer than a worker's share is itself cut
+into frame ranges: each worker interpolates only the alphas of its own frames
+and encodes them, and the chunks are joined in order like any other run.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+import os
+from pathlib import Path
+import secrets
+import sys
+import time
+
+from toolkit.render import configure, create_scene
+
+# Skip every animation during the planning pass
+SKIP_ALL = 10**9
+
+
+@dataclass
+class Play:
+    """One ``play``/``wait`` call as seen by the planning pass."""
+
+    duration: float
+    frames: int
+    # Still frames (a plain wait) are written in one go and cost next to nothing
+    frozen: bool
+
+    @property
+    def cost(self):
+        return 1 if self.frozen else max(self.frames, 1)
+
+
+def plan_plays(path, name, quality="l", seed=None):
+    """Every ``play``/``wait`` call of the scene, in order, as `Play`s.
+
+    Also warms the TeX, glyph and walk caches before the workers start, so they
+    don't all compile the same files at once.
+    """
+    import numpy as np
+
+    config = configure(path, quality, dry_run=True, from_animation_number=SKIP_ALL)
+    scene = create_scene(path, name, seed)
+    plays = []
+    renderer_play = scene.renderer.play
+
+    def play(played, *args, **kwargs):
+        renderer_play(played, *args, **kwargs)
+        # Same frame times as Scene.get_time_progression
+        frames = len(np.arange(0, played.duration, 1 / config.frame_rate))
+        plays.append(Play(played.duration, frames, played.is_current_animation_frozen_frame()))
+
+    scene.renderer.play = play
+    scene.render()
+    return plays
+
+
+def split_plays(plays, parts, split_long=False):
+    """Cut `plays` into ``(first, last, frames)`` runs of similar cost for `parts` workers.
+
+    A run covers the calls `first` to `last`; `frames` is ``None`` for whole
+    calls or a ``(start, stop)`` frame range when `split_long` has cut a single
+    long animation into several runs.
+    """
+    target = sum(p.cost for p in plays) / parts
+    runs, first, done = [], 0, 0
+    for i, play in enumerate(plays):
+        if split_long and not play.frozen and play.cost > target and play.frames > 1:
+            if first < i:
+                runs.append((first, i - 1, None))
+            pieces = min(-(-play.cost // max(int(target), 1)), play.frames)
+            bounds = [play.frames * k // pieces for k in range(pieces + 1)]
+            runs.extend((i, i, (start, stop)) for start, stop in zip(bounds, bounds[1:]))
+            first, done = i + 1, 0
+            continue
+        done += play.cost
+        if done >= target and i < len(plays) - 1:
+            runs.append((first, i, None))
+            first, done = i + 1, 0
+    if first < len(plays):
+        runs.append((first, len(plays) - 1, None))
+    return runs
+
+
+def limit_frames(scene, index, start, stop):
+    """Make call `index` of `scene` interpolate and render only its frames `start` to `stop - 1`."""
+    get_time_progression = scene.get_time_progression
+
+    def time_progression(*args, **kwargs):
+        progression = get_time_progression(*args, **kwargs)
+        if scene.renderer.num_plays == index and not scene.renderer.skip_animations:
+            progression.iterable = progression.iterable[start:stop]
+            progression.total = len(progression.iterable)
+        return progression
+
+    scene.get_time_progression = time_progression
+
+
+def render_plays(path, name, first, last, output_file, quality="l", seed=None, frames=None):
+    """Render calls `first` to `last` (inclusive) of the scene to ``output_file``; returns the movie path.
+
+    `frames` restricts a single call to a ``(start, stop)`` frame range.
+    """
+    # Partial movies of the other workers share the cache directory, so never prune it
+    overrides = {"max_files_cached": -1}
+    if frames is not None:
+        # Each frame range of the same animation would get the same cache entry
+        overrides.update(disable_caching=True, partial_movie_dir=f"{{video_dir}}/partial_movie_files/{output_file}")
+    configure(
+        path,
+        quality,
+        from_animation_number=first,
+        upto_animation_number=last,
+        output_file=output_file,
+        **overrides,
+    )
+    scene = create_scene(path, name, seed)
+    if frames is not None:
+        limit_frames(scene, first, *frames)
+    scene.render()
+    return scene.renderer.file_writer.movie_file_path
+
+
+def render_sections(path, name, workers=None, quality="l", seed=None, split_long=False):
+    """Render the scene `name` from `path` across `workers` processes and return the joined movie."""
+    from toolkit.video import concat_videos
+
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = secrets.randbelow(2**31)
+    with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+        plays = pool.submit(plan_plays, path, name, quality, seed).result()
+        if not plays:
+            raise ValueError(f"{name} has no animations to render")
+        runs = split_plays(plays, workers, split_long)
+        print(f"{name}: {len(plays)} animations in {len(runs)} runs (seed {seed})", flush=True)
+        futures = [
+            pool.submit(render_plays, path, name, first, last, f"{name}_run{i:03d}", quality, seed, frames)
+            for i, (first, last, frames) in enumerate(runs)
+        ]
+        pieces = [Path(future.result()) for future in futures]
+
+    output = pieces[0].with_name(f"{name}{pieces[0].suffix}")
+    concat_videos(pieces, output)
+    for piece in pieces:
+        piece.unlink()
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m toolkit.sections", description="Render one scene across several processes")
+    parser.add_argument("file", help="scene file")
+    parser.add_argument("scene", help="scene class name")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk", help="manim quality flag (default: l)")
+    parser.add_argument("--seed", type=int, help="random seed shared by all workers (default: a fresh one)")
+    parser.add_argument("--split-long", action="store_true", help="also split single long animations by frame range")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    output = render_sections(args.file, args.scene, args.workers, args.quality, args.seed, args.split_long)
+    print(f"{output} ready in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
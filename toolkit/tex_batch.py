@@ -0,0 +1,135 @@
+"""Compile all the MathTex strings of a scene in a single LaTeX run."""
+
+import ast
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import subprocess
+import tempfile
+
+from manim import MathTex, TexTemplate, config, logger
+from manim.utils.tex_file_writing import tex_hash
+
+TEX_ENVIRONMENT = "align*"
+# The batch document emulates this class with article + preview; other classes
+# would crop or lay out differently, so their templates aren't batched.
+BATCHED_DOCUMENTCLASS = TexTemplate().documentclass
+
+
+def scene_tex_specs(path):
+    """The ``MathTex`` calls in the source file `path` whose arguments are literals.
+
+    Returns a list of ``(tex_strings, arg_separator)`` pairs. Calls built from
+    variables or using substring isolation are left out; they still compile
+    lazily as usual.
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    specs = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "MathTex"):
+            continue
+        if not node.args or not all(isinstance(a, ast.Constant) and isinstance(a.value, str) for a in node.args):
+            continue
+        keywords = {k.arg: k.value for k in node.keywords}
+        if set(keywords) & {None, "substrings_to_isolate", "tex_to_color_map", "tex_environment", "tex_template"}:
+            continue
+        separator = keywords.get("arg_separator", ast.Constant(" "))
+        if not isinstance(separator, ast.Constant):
+            continue
+        specs.append((tuple(a.value for a in node.args), separator.value))
+    return specs
+
+
+def math_tex_expression(tex_strings, arg_separator=" "):
+    """The expression ``MathTex(*tex_strings)`` hands to ``tex_to_svg_file``.
+
+    Returns ``None`` if this manim's ``MathTex`` no longer has the private
+    helpers used to build it; the expressions then compile as usual.
+    """
+    # Borrow MathTex's own string handling so the hash matches exactly.
+    mob = MathTex.__new__(MathTex)
+    mob.arg_separator = arg_separator
+    mob.brace_notation_split_occurred = False
+    mob.matched_strings_and_ids = []
+    try:
+        joined = mob._join_tex_strings_with_unique_deliminters(mob._prepare_tex_strings(tex_strings), [])
+        return mob._get_modified_expression(joined)
+    except (AttributeError, TypeError):
+        return None
+
+
+def _batch_document(expressions, tex_template):
+    # One preview box per expression; with tightpage each box becomes its own
+    # page of the DVI, cropped just like a standalone document would be.
+    pages = [f"\\begin{{preview}}\n\\begin{{{TEX_ENVIRONMENT}}}\n{e}\n\\end{{{TEX_ENVIRONMENT}}}\n\\end{{preview}}" for e in expressions]
+    return "\n".join(
+        filter(
+            None,
+            [
+                r"\documentclass{article}",
+                r"\usepackage[active,tightpage]{preview}",
+                tex_template.preamble,
+                r"\begin{document}",
+                tex_template.post_doc_commands,
+                *pages,
+                r"\end{document}",
+            ],
+        )
+    )
+
+
+def precompile_tex(specs, workers=None):
+    """Compile every ``(tex_strings, arg_separator)`` in `specs` that manim has not cached yet.
+
+    The missing expressions go into one multi-page document, which is compiled
+    once; its pages are then converted to SVG in parallel and written exactly
+    where ``tex_to_svg_file`` looks for them, so the later ``MathTex`` calls
+    start from manim's own cache. Returns the number of expressions compiled.
+    """
+    tex_template = config.tex_template
+    if tex_template._body or tex_template.output_format != ".dvi" or tex_template.documentclass != BATCHED_DOCUMENTCLASS:
+        # Custom bodies, document classes and PDF output can't be paged this way.
+        return 0
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    missing = {}
+    for tex_strings, arg_separator in specs:
+        expression = math_tex_expression(tex_strings, arg_separator)
+        if expression is None:
+            return 0
+        texcode = tex_template.get_texcode_for_expression_in_env(expression, TEX_ENVIRONMENT)
+        svg_file = tex_dir / f"{tex_hash(texcode)}.svg"
+        if not svg_file.exists():
+            missing[svg_file] = (expression, texcode)
+    if not missing:
+        return 0
+
+    with tempfile.TemporaryDirectory(dir=tex_dir) as build_dir:
+        batch_file = Path(build_dir) / "batch.tex"
+        batch_file.write_text(_batch_document([e for e, _ in missing.values()], tex_template), encoding="utf-8")
+        compiler = tex_template.tex_compiler if isinstance(tex_template.tex_compiler, str) else tex_template.tex_compiler[0]
+        command = [compiler, "-interaction=batchmode", "-output-format=dvi", "-halt-on-error", f"-output-directory={build_dir}", batch_file.as_posix()]
+        if subprocess.run(command, stdout=subprocess.DEVNULL).returncode != 0:
+            # Leave it to the per-mobject pipeline, which reports TeX errors properly.
+            logger.warning("Batch TeX compilation failed; falling back to one run per MathTex.")
+            return 0
+        dvi_file = batch_file.with_suffix(".dvi")
+
+        def convert(page, svg_file, texcode):
+            partial = Path(build_dir) / f"page{page}.svg"
+            command = ["dvisvgm", f"--page={page}", "--no-fonts", "--verbosity=0", f"--output={partial.as_posix()}", dvi_file.as_posix()]
+            subprocess.run(command, stdout=subprocess.DEVNULL)
+            if partial.exists():
+                svg_file.with_suffix(".tex").write_text(texcode, encoding="utf-8")
+                os.replace(partial, svg_file)
+
+        with ThreadPoolExecutor(workers or os.cpu_count()) as pool:
+            jobs = [pool.submit(convert, page, svg_file, texcode) for page, (svg_file, (_, texcode)) in enumerate(missing.items(), start=1)]
+            for job in jobs:
+                job.result()
+    return len(missing)
+
+
+def precompile_scene_tex(path, workers=None):
+    """`precompile_tex` for every literal ``MathTex`` in the source file `path`."""
+    return precompile_tex(scene_tex_specs(path), workers)
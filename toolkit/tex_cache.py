@@ -0,0 +1,88 @@
+"""Cross-run cache for small MathTex labels such as vertex letters."""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+from manim import DEFAULT_FONT_SIZE, MathTex, VGroup, config
+
+from toolkit.outlines import load_outlines, save_outlines
+
+# Bump when the stored layout changes so stale files are ignored.
+CACHE_VERSION = 1
+TEX_ENVIRONMENT = "align*"
+
+# In-process prototypes keyed like the files on disk; callers get copies.
+_prototypes = {}
+
+
+class CachedTex(VGroup):
+    """A MathTex rebuilt from cached glyph outlines.
+
+    Only the geometry and colours are kept, so it supports everything a plain
+    ``VGroup`` does (``scale``, ``move_to``, ``Write``...) but not the
+    substring lookups of ``MathTex``.
+    """
+
+    def __init__(self, tex_string, glyphs=(), **kwargs):
+        super().__init__(*glyphs, **kwargs)
+        self.tex_string = tex_string
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.tex_string!r})"
+
+
+def cache_dir():
+    return Path(config.media_dir) / "glyph_cache"
+
+
+def tex_key(tex_string):
+    """Hash of everything that decides the compiled outline of `tex_string`."""
+    texcode = config.tex_template.get_texcode_for_expression_in_env(tex_string.strip(), TEX_ENVIRONMENT)
+    return hashlib.sha1(f"{CACHE_VERSION}\n{texcode}".encode()).hexdigest()[:16]
+
+
+def prefetch_tex(tex_strings):
+    """Make sure every string in `tex_strings` is cached.
+
+    Strings found neither in memory nor on disk are compiled together as the
+    parts of a single ``MathTex``, so a cold cache costs one LaTeX run however
+    many labels are missing. TeX outlines are scaled per font unit, so each part
+    matches what a standalone ``MathTex`` of the same string would draw.
+    """
+    missing = []
+    for tex_string in dict.fromkeys(tex_strings):
+        key = tex_key(tex_string)
+        if key in _prototypes:
+            continue
+        path = cache_dir() / f"tex_{key}.npz"
+        if path.exists():
+            _prototypes[key] = CachedTex(tex_string, load_outlines(path))
+        else:
+            missing.append(tex_string)
+    if not missing:
+        return
+    batch = MathTex(*missing, arg_separator=r"\quad ")
+    for tex_string, part in zip(missing, batch.submobjects):
+        part.move_to(np.zeros(3))
+        glyphs = part.family_members_with_points()
+        key = tex_key(tex_string)
+        save_outlines(cache_dir() / f"tex_{key}.npz", glyphs)
+        _prototypes[key] = CachedTex(tex_string, [glyph.copy() for glyph in glyphs])
+
+
+def cached_tex(tex_string, font_size=DEFAULT_FONT_SIZE, color=None):
+    """A copy of the cached outline of `tex_string`, centred at the origin.
+
+    Behaves like ``MathTex(tex_string, font_size=..., color=...)`` for the
+    purposes of placing and animating a label.
+    """
+    key = tex_key(tex_string)
+    if key not in _prototypes:
+        prefetch_tex([tex_string])
+    label = _prototypes[key].copy()
+    if font_size != DEFAULT_FONT_SIZE:
+        label.scale(font_size / DEFAULT_FONT_SIZE)
+    if color is not None:
+        label.set_color(color)
+    return label
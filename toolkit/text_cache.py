@@ -0,0 +1,139 @@
+"""Cross-run cache for ``Text`` mobjects.
+
+``Text`` lays its string out with Pango, writes an SVG and parses it back into
+paths every time it is built. `cached_text` does that once per string and set
+of arguments (font, size, weight, line spacing, colours ...) and keeps the
+outlines in ``media/text_cache``; later runs load them straight from there.
+
+The cache is bounded: once its files take more than ``TEXT_CACHE_MB`` (default
+64) megabytes, the least recently used are deleted. Hits and misses are logged
+when the render finishes.
+"""
+
+import atexit
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import manimpango
+from manim import Text, VGroup, __version__ as manim_version, config, logger
+
+from toolkit.outlines import load_outlines, save_outlines
+
+# Bump when the stored layout changes so stale files are ignored.
+CACHE_VERSION = 1
+DEFAULT_CACHE_MB = 64
+
+
+@dataclass
+class TextCacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evicted: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.memory_hits + self.disk_hits} hits ({self.disk_hits} from disk), "
+            f"{self.misses} misses, {self.evicted} files evicted"
+        )
+
+
+stats = TextCacheStats()
+_reporting = False
+# In-process prototypes keyed like the files on disk; callers get copies.
+_prototypes = {}
+
+
+class CachedText(VGroup):
+    """A ``Text`` rebuilt from cached outlines, one submobject per character.
+
+    Only the geometry and colours are kept, so it supports everything a plain
+    ``VGroup`` does (``move_to``, ``Write``, indexing characters ...) but not
+    the ``t2c``-style lookups of ``Text``.
+    """
+
+    def __init__(self, text, chars=(), **kwargs):
+        super().__init__(*chars, **kwargs)
+        self.original_text = text
+        # As Text: the characters that have a submobject each
+        self.text = text.replace(" ", "").replace("\n", "")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.original_text!r})"
+
+
+def cache_dir():
+    return Path(config.media_dir) / "text_cache"
+
+
+def cache_budget_bytes():
+    return float(os.environ.get("TEXT_CACHE_MB", DEFAULT_CACHE_MB)) * 2**20
+
+
+def text_key(text, **kwargs):
+    """Hash of the string, the ``Text`` arguments and the versions that lay it out."""
+    payload = {
+        "version": CACHE_VERSION,
+        "text": text,
+        "kwargs": {name: repr(value) for name, value in kwargs.items()},
+        "manim": manim_version,
+        "manimpango": manimpango.__version__,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def evict(directory=None, budget_bytes=None, keep=()):
+    """Delete the least recently used cache files until they fit in `budget_bytes`."""
+    directory = Path(directory or cache_dir())
+    budget_bytes = cache_budget_bytes() if budget_bytes is None else budget_bytes
+    files = []
+    for path in directory.glob("text_*.npz"):
+        try:
+            info = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((info.st_mtime, info.st_size, path))
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= budget_bytes:
+            break
+        if path in keep:
+            continue
+        path.unlink(missing_ok=True)
+        total -= size
+        stats.evicted += 1
+
+
+def log_stats():
+    """Log the cache stats of this process, if any text was looked up."""
+    if stats.misses + stats.memory_hits + stats.disk_hits:
+        logger.info("Text cache: %(s)s", {"s": str(stats)})
+
+
+def cached_text(text, **kwargs):
+    """A copy of the outlines ``Text(text, **kwargs)`` would draw, from the cache when possible."""
+    global _reporting
+    if not _reporting:
+        atexit.register(log_stats)
+        _reporting = True
+
+    key = text_key(text, **kwargs)
+    if key in _prototypes:
+        stats.memory_hits += 1
+        return _prototypes[key].copy()
+    path = cache_dir() / f"text_{key}.npz"
+    try:
+        chars = load_outlines(path)
+        # The modification time is the last use, for eviction
+        os.utime(path)
+        stats.disk_hits += 1
+    except FileNotFoundError:
+        chars = [char.copy() for char in Text(text, **kwargs).submobjects]
+        save_outlines(path, chars)
+        evict(keep={path})
+        stats.misses += 1
+    _prototypes[key] = CachedText(text, chars)
+    return _prototypes[key].copy()
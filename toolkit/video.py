@@ -0,0 +1,83 @@
+"""Small video-file helpers shared by the render tools."""
+
+from fractions import Fraction
+from io import BytesIO
+from pathlib import Path
+
+import av
+
+
+def concat_videos(inputs, output):
+    """Join the video files `inputs`, in order, into `output` without re-encoding.
+
+    Uses ffmpeg's concat demuxer (through PyAV, as manim itself does), so the
+    inputs must share codec, resolution and frame rate, which holds for pieces
+    of one scene rendered with the same settings.
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    manifest = "".join(f"file '{Path(p).resolve().as_posix()}'\n" for p in inputs)
+    with av.open(BytesIO(manifest.encode()), format="concat", options={"safe": "0"}) as source:
+        stream = source.streams.video[0]
+        with av.open(str(output), mode="w") as target:
+            output_stream = target.add_stream_from_template(template=stream)
+            for packet in source.demux(stream):
+                # Skip the flushing packets demux emits at the end
+                if packet.dts is None:
+                    continue
+                packet.stream = output_stream
+                # As manim's combine_files: DTS of consecutive files need not
+                # increase, so let the muxer derive them
+                packet.dts = None
+                target.mux(packet)
+    return output
+
+
+def retime(source, target, width=None, height=None, rate=None):
+    """Re-encode `source` into `target` at a constant `rate`, scaled to `width` x `height`.
+
+    Each output frame shows the source frame on screen at its time, so held
+    frames of a variable frame rate video are repeated and a higher source
+    frame rate is decimated. Unset arguments keep the source's values.
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with av.open(str(source)) as inp:
+        in_stream = inp.streams.video[0]
+        context = in_stream.codec_context
+        # The nominal rate; the average of a held-frame (VFR) video is lower
+        source_rate = in_stream.base_rate or in_stream.guessed_rate
+        rate = Fraction(rate or source_rate)
+        width, height = width or context.width, height or context.height
+        with av.open(str(target), mode="w") as out:
+            stream = out.add_stream(context.name, rate=rate)
+            stream.pix_fmt = context.pix_fmt
+            stream.width, stream.height = width, height
+            index = 0
+
+            def emit(frame, until):
+                nonlocal index
+                scaled = None
+                # Output frame `index` starts at index / rate
+                while index / rate < until:
+                    if scaled is None:
+                        scaled = frame.reformat(width=width, height=height, format=context.pix_fmt, interpolation="AREA")
+                        scaled.time_base = 1 / rate
+                    scaled.pts = index
+                    index += 1
+                    for packet in stream.encode(scaled):
+                        out.mux(packet)
+
+            previous = start = None
+            for frame in inp.decode(in_stream):
+                time = Fraction(frame.pts * frame.time_base)
+                if previous is None:
+                    start = time
+                else:
+                    emit(previous, time - start)
+                previous, previous_time = frame, time
+            if previous is not None:
+                emit(previous, previous_time - start + 1 / Fraction(source_rate))
+            for packet in stream.encode():
+                out.mux(packet)
+    return target
@@ -0,0 +1,150 @@
+"""NumPy helpers for the random walk scenes."""
+
+from dataclasses import dataclass, fields
+import hashlib
+import json
+from math import comb
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+def lattice_edges(num_steps):
+    """Return every distinct edge of the +-1 walk lattice after `num_steps` steps.
+
+    The result is four arrays ``(steps, y_starts, y_ends, counts)`` with one entry
+    per edge: the x-step the edge starts at, its start and end heights (in steps),
+    and how many of the 2^num_steps paths run along it.
+    """
+    steps, y_starts, y_ends, counts = [], [], [], []
+    for k in range(num_steps):
+        # Nodes at step k sit at heights -k, -k+2, ..., k; comb(k, j) paths reach
+        # the node with j up-moves and each of them continues in 2^(n-k-1) ways
+        # once it has taken one of the two outgoing edges.
+        continuations = 2 ** (num_steps - k - 1)
+        for j in range(k + 1):
+            y = 2 * j - k
+            through = comb(k, j) * continuations
+            for direction in (1, -1):
+                steps.append(k)
+                y_starts.append(y)
+                y_ends.append(y + direction)
+                counts.append(through)
+    return (
+        np.array(steps, dtype=int),
+        np.array(y_starts, dtype=int),
+        np.array(y_ends, dtype=int),
+        np.array(counts, dtype=float),
+    )
+
+
+def stacked_opacity(counts, opacity):
+    """Opacity of `counts` identical strokes of `opacity` drawn on top of each other."""
+    return 1 - (1 - opacity) ** np.asarray(counts, dtype=float)
+
+
+def random_steps(count, rng=None):
+    """Draw `count` random +-1 steps as an int8 array."""
+    rng = np.random.default_rng() if rng is None else rng
+    return rng.integers(0, 2, size=count, dtype=np.int8) * np.int8(2) - np.int8(1)
+
+
+def walk_heights(steps, start=0):
+    """Heights visited by a walk of +-1 `steps`, including the starting height."""
+    heights = np.empty(len(steps) + 1, dtype=np.int64)
+    heights[0] = 0
+    np.cumsum(steps, dtype=np.int64, out=heights[1:])
+    heights += start
+    return heights
+
+
+@dataclass
+class WalkParams:
+    """Parameters of the RandomWalk scene.
+
+    Defaults can be overridden by a JSON file named in ``RANDOMWALK_CONFIG`` and,
+    on top of that, by ``RANDOMWALK_<FIELD>`` environment variables such as
+    ``RANDOMWALK_SEED=7``.
+    """
+
+    num_steps: int = 8
+    additional_steps: int = 500
+    step_size: float = 1.0
+    seed: Optional[int] = None
+    ensemble_walks: int = 0  # 0 turns ensemble mode off
+    ensemble_workers: Optional[int] = None  # None uses every core
+
+    def __post_init__(self):
+        self.num_steps = int(self.num_steps)
+        self.additional_steps = int(self.additional_steps)
+        self.step_size = float(self.step_size)
+        self.ensemble_walks = int(self.ensemble_walks)
+        if self.seed is not None:
+            self.seed = int(self.seed)
+        if self.ensemble_workers is not None:
+            self.ensemble_workers = int(self.ensemble_workers)
+
+    @property
+    def total_steps(self):
+        return self.num_steps + self.additional_steps
+
+    @classmethod
+    def load(cls, environ=None):
+        environ = os.environ if environ is None else environ
+        values = {}
+        config_file = environ.get("RANDOMWALK_CONFIG")
+        if config_file:
+            with open(config_file) as f:
+                values.update(json.load(f))
+        for field in fields(cls):
+            value = environ.get(f"RANDOMWALK_{field.name.upper()}")
+            if value is not None:
+                values[field.name] = value
+        unknown = set(values) - {field.name for field in fields(cls)}
+        if unknown:
+            raise ValueError(f"Unknown RandomWalk parameters: {', '.join(sorted(unknown))}")
+        return cls(**values)
+
+    def to_env(self):
+        """Environment variables that make `load` return these parameters."""
+        return {
+            f"RANDOMWALK_{field.name.upper()}": str(getattr(self, field.name))
+            for field in fields(self)
+            if getattr(self, field.name) is not None
+        }
+
+
+def cached_walk_heights(seed, num_steps, cache_dir, chunk_size=1 << 20):
+    """Heights of the seeded `num_steps`-step walk, cached as a ``.npy`` file.
+
+    The first call streams the walk chunk by chunk into the file, so memory stays
+    bounded; later calls with the same seed and length reopen it memory-mapped
+    and skip generation entirely.
+    """
+    key = json.dumps({"seed": seed, "steps": num_steps, "chunk_size": chunk_size})
+    path = Path(cache_dir) / f"walk_{hashlib.sha1(key.encode()).hexdigest()[:16]}.npy"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        heights = np.lib.format.open_memmap(partial, mode="w+", dtype=np.int32, shape=(num_steps + 1,))
+        heights[0] = 0
+        rng = np.random.default_rng(seed)
+        for start in range(0, num_steps, chunk_size):
+            count = min(chunk_size, num_steps - start)
+            heights[start + 1 : start + count + 1] = walk_heights(random_steps(count, rng), heights[start])[1:]
+        heights.flush()
+        del heights
+        os.replace(partial, path)
+    return np.load(path, mmap_mode="r")
+
+
+def walk_for(params, cache_dir):
+    """Heights of the full walk described by `params`.
+
+    Seeded walks go through `cached_walk_heights`; unseeded ones are drawn fresh.
+    """
+    if params.seed is None:
+        return walk_heights(random_steps(params.total_steps))
+    return cached_walk_heights(params.seed, params.total_steps, cache_dir)